@@ -1,21 +1,283 @@
+import asyncio
+import atexit
+import heapq
+import threading
+
 import flet as ft
 import json
-from datetime import datetime
+import uuid
+from datetime import date, datetime
 import math
-from collections import Counter
-
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+
+# orjson serializa/parseia JSON várias vezes mais depressa que o módulo
+# padrão; é opcional — sem ele tudo funciona com json puro
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        # Separadores compactos: menos bytes por gravação no client_storage
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
+
+# Cores de sinal usadas em saldos e progressos
+KZ_GREEN = "#059669"
+KZ_RED = "#DC2626"
+_SIGN_COLORS = (KZ_RED, KZ_GREEN)
+
+
+def _sign_color(is_positive):
+    # Indexação pelo bool evita o ternário repetido nos call sites
+    return _SIGN_COLORS[bool(is_positive)]
+
+
+def _safe_kz(value):
+    """Converte o texto de um campo em Kwanzas inteiros sem levantar exceção
+
+    Pré-valida antes de converter: levantar e apanhar ValueError como
+    controlo de fluxo é ordens de grandeza mais caro do que este branch.
+    A app não mostra centavos, por isso os montantes vivem como int —
+    somas e comparações mais baratas e sem artefactos de vírgula
+    flutuante nos saldos. Devolve None para entrada vazia ou não numérica.
+    """
+    s = (value or "").strip().replace(",", ".")
+    # Só um sinal à cabeça conta como número — "5-3" tem de ser rejeitado
+    digits = s[1:] if s.startswith("-") else s
+    if not digits or not digits.replace(".", "", 1).isdigit():
+        return None
+    return int(round(float(s)))
+
+
+def _as_kz(value):
+    """Reduz um montante persistido como float exato a int, se possível"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+@lru_cache(maxsize=512)
+def _fmt_num(valor):
+    """Formata um número com separador de milhares (cacheado entre re-renderizações)"""
+    return f"{valor:,.0f}"
+
+
+def _fmt_kz(valor):
+    """Formata um valor monetário com o sufixo Kz"""
+    return f"{_fmt_num(valor)} Kz"
+
+
+# Configuração partilhada pelos diálogos de pagamento (metas e dívidas);
+# só mudam cores, rótulos e a lista alvo — a lógica é idêntica.
+PAYMENT_DIALOG_THEMES = {
+    'goal': {
+        'label': 'meta',
+        'list_attr': 'goals',
+        'paid_key': 'saved_amount',
+        'total_key': 'total_cost',
+        'paid_label': 'Investido',
+        'accent': '#059669',
+        'icon': ft.Icons.SAVINGS,
+        'emoji': '🎯',
+        'title': 'Investir na Meta',
+        'desc_prefix': '💰 Meta: ',
+        'button_text': '💰 Investir',
+        'success_message': '💰 Investimento realizado com sucesso!',
+        'card_bgcolor': '#F8FAFC',
+        'card_border': '#E2E8F0'
+    },
+    'debt': {
+        'label': 'dívida',
+        'list_attr': 'debts',
+        'paid_key': 'paid_amount',
+        'total_key': 'total_amount',
+        'paid_label': 'Pago',
+        'accent': '#DC2626',
+        'icon': ft.Icons.PAYMENT,
+        'emoji': '💳',
+        'title': 'Pagar Dívida',
+        'desc_prefix': '💳 Dívida: ',
+        'button_text': '💳 Pagar',
+        'success_message': '💳 Pagamento realizado com sucesso!',
+        'card_bgcolor': '#FEF2F2',
+        'card_border': '#FECACA'
+    }
+}
+
+# Pacotes de estilo por tipo de transação — (ícone, cor, fundo) congelados
+# uma vez em vez de re-materializados por linha em cada reconstrução
+_EXPENSE_ROW_STYLES = {
+    'income': (ft.Icons.ARROW_UPWARD, "#059669", "#ECFDF5"),
+    'goal': (ft.Icons.SAVINGS, "#059669", "#ECFDF5"),
+    'debt': (ft.Icons.PAYMENT, "#DC2626", "#FEF2F2"),
+    'expense': (ft.Icons.ARROW_DOWNWARD, "#EC4899", "#FDF2F8"),
+}
+
+
+# Estilos imutáveis partilhados — o equivalente em Python aos construtores
+# "const" do Flutter: uma alocação, reutilizada por referência.
+_BORDER_GRAY = ft.border.all(1, "#E5E7EB")
+_BORDER_LIGHT = ft.border.all(1, "#F3F4F6")
+_PADDING_8 = ft.padding.all(8)
+_PADDING_12 = ft.padding.all(12)
+_PADDING_16 = ft.padding.all(16)
+_MARGIN_B8 = ft.margin.only(bottom=8)
+_MARGIN_B12 = ft.margin.only(bottom=12)
+_MARGIN_B16 = ft.margin.only(bottom=16)
+_CHIP_PADDING = ft.padding.symmetric(horizontal=12, vertical=6)
+_PADDING_0 = ft.padding.all(0)
+_PADDING_4 = ft.padding.all(4)
+_PADDING_20 = ft.padding.all(20)
+_BUTTON_PADDING = ft.padding.symmetric(vertical=14, horizontal=20)
+_DIALOG_ACTIONS_PADDING = ft.padding.symmetric(horizontal=20, vertical=16)
+
+# Estilos partilhados dos botões e forma dos diálogos — idênticos em todas
+# as instâncias, por isso vivem como singletons de módulo
+_CANCEL_BUTTON_STYLE = ft.ButtonStyle(color="#6B7280", overlay_color="#F3F4F6")
+_CONFIRM_BUTTON_STYLE = ft.ButtonStyle(shape=ft.RoundedRectangleBorder(radius=8))
+_DIALOG_SHAPE = ft.RoundedRectangleBorder(radius=16)
+
+# Sombras partilhadas — são sempre idênticas, por isso aloca-se uma única
+# instância por variante em vez de uma nova por widget.
+_CARD_SHADOW = ft.BoxShadow(spread_radius=0, blur_radius=8, color="#1F293720", offset=ft.Offset(0, 2))
+_SOFT_SHADOW = ft.BoxShadow(spread_radius=0, blur_radius=4, color="#1F293720", offset=ft.Offset(0, 2))
+_NAV_SHADOW = ft.BoxShadow(spread_radius=0, blur_radius=8, color="#1F293720", offset=ft.Offset(0, -2))
+
+# Sombras dos botões por cor de fundo — o conjunto de cores é pequeno e
+# fixo, por isso cada variante é alocada uma única vez
+_BUTTON_SHADOWS = {}
+
+
+def _button_shadow(color):
+    shadow = _BUTTON_SHADOWS.get(color)
+    if shadow is None:
+        shadow = ft.BoxShadow(
+            spread_radius=0,
+            blur_radius=8,
+            color=f"{color}40",
+            offset=ft.Offset(0, 2)
+        )
+        _BUTTON_SHADOWS[color] = shadow
+    return shadow
 
 class FinancialApp:
+    # Declarar os atributos de instância em __slots__ evita o __dict__ por
+    # instância e torna o acesso a atributos ligeiramente mais rápido
+    __slots__ = (
+        # Infraestrutura
+        'page', 'dialog_open', '_update_depth',
+        # Caches de controles e agregados
+        '_goal_card_cache', '_debt_card_cache', '_snack_bars',
+        '_expense_row_cache', '_agg_cache', '_analysis_cache',
+        '_categorize_cache', '_card_build_generation', '_mutation_count',
+        '_payment_dialog_refs', '_payment_kind', '_payment_index',
+        '_payment_balance', '_active_dialog', '_today_date', '_today_str',
+        '_receive_dialog_refs', '_receive_index',
+        # Gravação em segundo plano
+        '_save_timer', '_goal_time_timer', '_save_lock',
+        '_save_pending', '_dirty_sections',
+        # Estado financeiro
+        'base_salary', 'accumulated_balance', 'salary', 'expenses',
+        'goals', 'debts', 'debts_to_receive', 'current_month',
+        '_expense_amounts', '_expense_desc_keys', '_recent_expenses',
+        '_receive_totals', '_receive_received', '_total_to_receive',
+        # Navegação e views
+        'current_view_index', '_now_month', '_now_ym',
+        '_view_updaters', '_view_dirty', '_summary_sig',
+        'header', 'header_text', 'navigation_bar', 'content_container',
+        'finances_view', 'goals_view', 'extras_view', 'summary_view',
+        # Controles da view de finanças
+        'salary_field', 'summary_card', '_fin_month_text',
+        '_fin_total_text', '_fin_spent_text', '_fin_balance_text',
+        '_fin_usage_text', '_fin_balance_box', '_fin_analysis_slot',
+        'expense_description', 'expense_amount', 'expenses_list',
+        # Controles da view de metas
+        'goal_name', 'goal_total_cost', 'goal_monthly_saving',
+        'goal_time_estimate', 'goals_list', '_goals_balance_text',
+        # Controles da view de extras
+        'extra_income_description', 'extra_income_amount',
+        'debt_name', 'debt_total_amount', 'debt_monthly_payment',
+        'debt_to_receive_name', 'debt_to_receive_amount',
+        'debt_to_receive_due_date', 'debts_list', 'debts_to_receive_list',
+        # Controles da view de resumo
+        '_sum_salary_text', '_sum_spent_text', '_sum_balance_text',
+        '_sum_receive_text', '_sum_category_slots',
+    )
+
     def __init__(self, page: ft.Page):
         self.page = page
         self.dialog_open = False  # Controle manual de diálogo
+        self._update_depth = 0  # Profundidade de lotes de update em curso
+        self._goal_card_cache = {}  # id da meta -> referências do cartão
+        self._debt_card_cache = {}  # id da dívida -> referências do cartão
+        self._snack_bars = {}  # (mensagem, cor) -> SnackBar reutilizável
+        self._expense_row_cache = {}  # id da despesa -> linha construída
+        self._payment_dialog_refs = None  # diálogo de pagamento reutilizável
+        self._payment_kind = None  # 'goal' ou 'debt' do diálogo ativo
+        self._payment_index = None  # índice do item do diálogo ativo
+        self._payment_balance = 0.0  # saldo disponível na abertura do diálogo
+        self._active_dialog = None  # diálogo atualmente aberto, para o fecho vinculado
+        self._receive_dialog_refs = None  # diálogo de recebimento reutilizável
+        self._receive_index = None  # índice da dívida a receber ativa
+        self._today_date = None  # dia a que corresponde a string cacheada
+        self._today_str = None  # data de hoje já formatada ("DD/MM/AAAA")
+        self._agg_cache = None  # (total_gasto, total_extra, tem_extra)
+        self._analysis_cache = None  # resultado memoizado da análise de gastos
+        self._categorize_cache = None  # transações categorizadas para o dashboard
+        self._mutation_count = 0  # nº de mutações das despesas, para assinaturas
+        self._card_build_generation = {}  # invalida construções diferidas antigas
+        self._save_timer = None  # Timer da gravação debounced
+        self._goal_time_timer = None  # Timer do debounce da estimativa de meta
+        self._save_lock = threading.Lock()
+        self._save_pending = False
+        self._dirty_sections = set()  # secções a persistir no próximo flush
         self.current_view_index = 0  # Para controlar a view atual
+        # O mês corrente é capturado uma única vez por arranque e
+        # reutilizado no load e na verificação de virada de mês
+        now = datetime.now()
+        self._now_month = now.strftime(self._MONTH_FMT)
+        self._now_ym = (now.year, now.month)
+        # Sentinelas explícitas: permitem testar com "is not None" em vez
+        # de hasattr, que repete uma pesquisa de string a cada chamada
+        self.header_text = None
+        self.navigation_bar = None
+        self.content_container = None
+        self.finances_view = None
+        self._summary_sig = None  # assinatura da última construção do dashboard
+        # Flags de "vista desatualizada": mutações marcam, a navegação só
+        # reconstrói/atualiza quando a flag está ativa
+        self._view_dirty = [False, False, False, False]
         self.setup_page()
         self.load_data()
         self.check_new_month()
         self.create_components()
         self.setup_layout()
 
+        # Tabela de despacho indexada pela view atual — substitui as
+        # cadeias if/elif repetidas em cada ponto de navegação
+        self._view_updaters = (
+            self.update_finances_view,
+            self.update_goals_view,
+            self.update_extras_view,
+            self.update_summary_view,
+        )
+
+        # Garante que alterações pendentes são persistidas ao sair
+        self.page.on_disconnect = self._on_disconnect
+        atexit.register(self._flush_save)
+
     def setup_page(self):
         """Configuração inicial da página com design premium e mobile-first"""
         self.page.title = "✨ Gestão Financeira"
@@ -38,151 +300,419 @@ class FinancialApp:
         # Remove barra superior padrão para controle total
         self.page.appbar = None
 
-    def load_data(self):
-        """Carrega dados do client_storage"""
-        try:
-            salary_data = self.page.client_storage.get("salary")
-            self.base_salary = float(salary_data) if salary_data else 0.0
-
-            accumulated_data = self.page.client_storage.get("accumulated_balance")
-            self.accumulated_balance = float(accumulated_data) if accumulated_data else 0.0
-
-            self.salary = self.base_salary + self.accumulated_balance
-
-            expenses_data = self.page.client_storage.get("expenses")
-            self.expenses = json.loads(expenses_data) if expenses_data else []
+    # Todo o estado vive numa única chave: um get/set por operação em vez
+    # de uma viagem IPC à runtime do Flet por cada campo
+    _STATE_KEY = "app_state_v1"
 
-            goals_data = self.page.client_storage.get("goals")
-            self.goals = json.loads(goals_data) if goals_data else []
+    # Formato do mês persistido; como class attr evita repetir o literal
+    _MONTH_FMT = "%m/%Y"
 
-            # Dívidas a pagar
-            debts_data = self.page.client_storage.get("debts")
-            self.debts = json.loads(debts_data) if debts_data else []
+    def load_data(self):
+        """Carrega dados do client_storage
+
+        Só a leitura/parse do armazenamento fica guardada por try — um blob
+        corrompido cai nos defaults campo a campo em vez de um except geral
+        descartar tudo o que já tinha sido carregado.
+        """
+        state = None
+        needs_migration = False
+        try:
+            # As secções v2 são lidas mesmo sem a meta: as gravações sujas
+            # escrevem chave a chave, pelo que uma instalação pode ter
+            # secções gravadas antes de alguma vez ter escrito a meta
+            meta_data = self.page.client_storage.get(self._SECTION_KEYS["meta"])
+            section_state = {}
+            for section in ("expenses", "goals", "debts", "debts_to_receive"):
+                section_data = self.page.client_storage.get(self._SECTION_KEYS[section])
+                if section_data:
+                    section_state[section] = _loads(section_data)
+            if meta_data or section_state:
+                # Formato por secções: junta as fatias num dict único
+                state = _loads(meta_data) if meta_data else {}
+                state.update(section_state)
+                # Sem meta gravada, completa as chaves em falta já no arranque
+                needs_migration = not meta_data
+            else:
+                # Blob v1 de instalações intermédias
+                state_data = self.page.client_storage.get(self._STATE_KEY)
+                if state_data:
+                    state = _loads(state_data)
+                needs_migration = True
+        except Exception as ex:
+            print(f"Erro ao ler estado guardado: {ex}")
+            state = None
+            # Com o armazenamento ilegível não se regrava nada: uma
+            # migração aqui podia substituir dados recuperáveis por defaults
+            needs_migration = False
+
+        if state is not None:
+            # Os números são guardados como números no blob — json.loads
+            # já devolve float, sem o round-trip por string do formato antigo
+            self.base_salary = _as_kz(state.get("base_salary") or 0)
+            self.accumulated_balance = _as_kz(state.get("accumulated_balance") or 0)
+            self.expenses = state.get("expenses") or []
+            self.goals = state.get("goals") or []
+            self.debts = state.get("debts") or []
+            self.debts_to_receive = state.get("debts_to_receive") or []
+            self.current_month = state.get("current_month") or self._now_month
+        else:
+            # Instalações antigas guardavam um valor por chave; a
+            # primeira gravação migra tudo para o blob único
+            try:
+                self._load_legacy_keys()
+            except Exception as ex:
+                print(f"Erro ao ler chaves antigas: {ex}")
+                self.base_salary = 0
+                self.accumulated_balance = 0
+                self.expenses = []
+                self.goals = []
+                self.debts = []
+                self.debts_to_receive = []
+                self.current_month = self._now_month
+
+        self.salary = self.base_salary + self.accumulated_balance
+        # Montantes gravados por versões antigas chegam como float; quando
+        # são exatos voltam a int para as somas correrem sobre inteiros
+        for expense in self.expenses:
+            expense['amount'] = _as_kz(expense['amount'])
+        self._expense_amounts = [expense['amount'] for expense in self.expenses]
+        self._expense_desc_keys = [expense['description'].lower().strip() for expense in self.expenses]
+        # Janela das últimas transações mantida incrementalmente — a lista
+        # de despesas deixa de ser fatiada em cada redesenho
+        self._recent_expenses = deque(self.expenses[-10:], maxlen=10)
+        self._invalidate_caches()
+
+        # Registos antigos ainda não trazem as strings pré-formatadas
+        for expense in self.expenses:
+            if '_display_desc' not in expense:
+                self._precompute_expense_display(expense)
+
+        # Normaliza registos antigos que não trazem os campos de progresso,
+        # para que os loops quentes possam indexar diretamente sem .get()
+        for goal in self.goals:
+            goal.setdefault('saved_amount', 0)
+            goal['saved_amount'] = _as_kz(goal['saved_amount'])
+            goal['total_cost'] = _as_kz(goal['total_cost'])
+        for debt in self.debts:
+            debt.setdefault('paid_amount', 0)
+            debt.setdefault('total_amount', 0)
+            debt['paid_amount'] = _as_kz(debt['paid_amount'])
+            debt['total_amount'] = _as_kz(debt['total_amount'])
+        for debt in self.debts_to_receive:
+            debt.setdefault('received_amount', 0)
+            debt.setdefault('total_amount', 0)
+            debt['received_amount'] = _as_kz(debt['received_amount'])
+            debt['total_amount'] = _as_kz(debt['total_amount'])
+
+        self._sync_receivable_arrays()
+
+        # Garante ids estáveis (registos antigos não os têm) para
+        # permitir reutilizar cartões e linhas entre atualizações
+        for item in self.expenses + self.goals + self.debts + self.debts_to_receive:
+            item.setdefault('id', uuid.uuid4().hex)
+
+        # Fontes pré-v2 (blob, chaves antigas ou secções órfãs) são migradas
+        # já: as gravações sujas só escrevem as secções alteradas e deixariam
+        # o resto invisível no próximo arranque
+        if needs_migration:
+            try:
+                self.save_data()
+            except Exception as ex:
+                print(f"Erro ao migrar estado para o formato por secções: {ex}")
+
+    def _load_legacy_keys(self):
+        """Lê o formato antigo de uma chave por campo"""
+        salary_data = self.page.client_storage.get("salary")
+        self.base_salary = _as_kz(float(salary_data)) if salary_data else 0
+
+        accumulated_data = self.page.client_storage.get("accumulated_balance")
+        self.accumulated_balance = _as_kz(float(accumulated_data)) if accumulated_data else 0
+
+        expenses_data = self.page.client_storage.get("expenses")
+        self.expenses = _loads(expenses_data) if expenses_data else []
+
+        goals_data = self.page.client_storage.get("goals")
+        self.goals = _loads(goals_data) if goals_data else []
+
+        debts_data = self.page.client_storage.get("debts")
+        self.debts = _loads(debts_data) if debts_data else []
+
+        debts_to_receive_data = self.page.client_storage.get("debts_to_receive")
+        self.debts_to_receive = _loads(debts_to_receive_data) if debts_to_receive_data else []
+
+        current_month_data = self.page.client_storage.get("current_month")
+        self.current_month = current_month_data if current_month_data else self._now_month
+
+    # Uma chave por secção: uma mutação só re-serializa e reescreve a
+    # fatia que mudou, em vez de amplificar cada toque para o blob inteiro
+    _SECTION_KEYS = {
+        "meta": "app_meta_v2",
+        "expenses": "app_expenses_v2",
+        "goals": "app_goals_v2",
+        "debts": "app_debts_v2",
+        "debts_to_receive": "app_debts_to_receive_v2",
+    }
+
+    def _section_payload(self, section):
+        """Serializa uma secção do estado"""
+        if section == "meta":
+            return _dumps({
+                "base_salary": self.base_salary,
+                "accumulated_balance": self.accumulated_balance,
+                "current_month": self.current_month
+            })
+        return _dumps(getattr(self, section))
 
-            # NOVA FUNCIONALIDADE: Dívidas a receber
-            debts_to_receive_data = self.page.client_storage.get("debts_to_receive")
-            self.debts_to_receive = json.loads(debts_to_receive_data) if debts_to_receive_data else []
+    def save_data(self):
+        """Salva todas as secções no client_storage"""
+        for section, key in self._SECTION_KEYS.items():
+            self.page.client_storage.set(key, self._section_payload(section))
+        self._dirty_sections.clear()
+
+    # Tempo de espera antes de persistir, para juntar mutações em rajada
+    _SAVE_DEBOUNCE_SECONDS = 0.5
+
+    def _schedule_save(self, *sections):
+        """Agenda uma gravação debounced numa thread de trabalho
+
+        Evita que cada toque bloqueie o frame com serialização JSON + I/O;
+        rajadas de mutações produzem uma única gravação. As secções
+        indicadas são marcadas como sujas; sem argumentos, todas.
+        """
+        self._dirty_sections.update(sections or self._SECTION_KEYS)
+        self._save_pending = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self._SAVE_DEBOUNCE_SECONDS, self._flush_save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _flush_save(self):
+        """Persiste já o estado pendente (seguro entre threads)"""
+        with self._save_lock:
+            if not self._save_pending:
+                return
+            # Se um lote de mutações ainda está a meio no thread de UI,
+            # rearma o timer em vez de serializar estado inconsistente
+            if self._update_depth > 0:
+                self._save_timer = threading.Timer(self._SAVE_DEBOUNCE_SECONDS, self._flush_save)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+                return
+            self._save_pending = False
+            dirty = self._dirty_sections
+            self._dirty_sections = set()
+            try:
+                # Escreve apenas as secções que mudaram desde o último flush
+                for section in dirty:
+                    self.page.client_storage.set(
+                        self._SECTION_KEYS[section], self._section_payload(section))
+            except Exception as ex:
+                print(f"Erro ao gravar dados: {ex}")
 
-            current_month_data = self.page.client_storage.get("current_month")
-            self.current_month = current_month_data if current_month_data else datetime.now().strftime("%m/%Y")
+    def _on_disconnect(self, e):
+        """Força a gravação pendente quando a app fecha/desliga"""
+        self._flush_save()
 
-        except:
-            self.base_salary = 0.0
-            self.accumulated_balance = 0.0
-            self.salary = 0.0
-            self.expenses = []
-            self.goals = []
-            self.debts = []
-            self.debts_to_receive = []  # Nova lista
-            self.current_month = datetime.now().strftime("%m/%Y")
 
-    def save_data(self):
-        """Salva dados no client_storage"""
-        self.page.client_storage.set("salary", str(self.base_salary))
-        self.page.client_storage.set("accumulated_balance", str(self.accumulated_balance))
-        self.page.client_storage.set("expenses", json.dumps(self.expenses))
-        self.page.client_storage.set("goals", json.dumps(self.goals))
-        self.page.client_storage.set("debts", json.dumps(self.debts))
-        self.page.client_storage.set("debts_to_receive", json.dumps(self.debts_to_receive))  # Nova linha
-        self.page.client_storage.set("current_month", self.current_month)
+    @staticmethod
+    def _month_tuple(month_str):
+        """Converte "MM/AAAA" no tuplo comparável (ano, mês)"""
+        try:
+            month, year = month_str.split("/")
+            return int(year), int(month)
+        except (ValueError, AttributeError):
+            return None
 
     def check_new_month(self):
-        """Verifica se é um novo mês e faz a transição automática"""
-        new_month = datetime.now().strftime("%m/%Y")
+        """Verifica se é um novo mês e faz a transição automática
 
-        if new_month != self.current_month and self.current_month != "":
+        A comparação usa tuplos (ano, mês) — dois ints — em vez de
+        strings formatadas, e sobrevive a mudanças no formato de exibição.
+        """
+        current_ym = self._month_tuple(self.current_month)
+
+        if current_ym is not None and self._now_ym != current_ym:
             total_spent, current_balance = self.calculate_totals()
 
             if current_balance > 0:
                 self.accumulated_balance += current_balance
 
             self.expenses = []
-            self.current_month = new_month
+            self._expense_amounts = []
+            self._expense_desc_keys = []
+            self._recent_expenses.clear()
+            self._invalidate_caches()
+            self.current_month = self._now_month
             self.salary = self.base_salary + self.accumulated_balance
             self.save_data()
 
+    def _sync_receivable_arrays(self):
+        """Reconstrói as listas paralelas usadas nas agregações do dashboard
+
+        Reconstruídas uma vez por mutação e lidas em todas as atualizações
+        de vista — o somatório corre sobre floats contíguos sem lookups
+        de dict por item.
+        """
+        self._receive_totals = [debt['total_amount'] for debt in self.debts_to_receive]
+        self._receive_received = [debt['received_amount'] for debt in self.debts_to_receive]
+        # O total a receber só muda quando estas listas mudam, por isso é
+        # somado aqui uma vez e lido como atributo nas vistas
+        self._total_to_receive = math.fsum(self._receive_totals) - math.fsum(self._receive_received)
+
+
+    def _append_expense(self, expense):
+        """Adiciona uma transação mantendo a lista paralela de valores em sincronia"""
+        expense.setdefault('id', uuid.uuid4().hex)
+        self._precompute_expense_display(expense)
+        self.expenses.append(expense)
+        self._expense_amounts.append(expense['amount'])
+        self._expense_desc_keys.append(expense['description'].lower().strip())
+        self._recent_expenses.append(expense)
+        self._invalidate_caches()
+
+    @staticmethod
+    def _precompute_expense_display(expense):
+        """Calcula as strings de exibição uma única vez, na inserção
+
+        A lista de despesas é redesenhada a cada atualização; truncar e
+        formatar aqui evita refazer o mesmo trabalho em todos os redesenhos.
+        """
+        description = expense['description']
+        expense['_display_desc'] = description[:30] + "..." if len(description) > 30 else description
+        expense['_display_amount'] = f"{_fmt_num(abs(expense['amount']))} Kz"
+
+    def _invalidate_caches(self):
+        """Descarta agregados derivados após mutações nas despesas"""
+        self._agg_cache = None
+        self._analysis_cache = None
+        self._categorize_cache = None
+        # Contador monotónico: distingue mutações que deixam os totais
+        # iguais (remover e re-adicionar o mesmo valor, por exemplo)
+        self._mutation_count += 1
+
+    def _aggregate(self):
+        """Passada única sobre os valores: (total_gasto, total_extra, tem_extra)
+
+        O resultado fica em cache até à próxima mutação — os vários sítios
+        que precisavam destes números faziam cada um a sua travessia da
+        lista de despesas.
+        """
+        if self._agg_cache is None:
+            # Dois fsum sobre a lista de floats correm em C (e com melhor
+            # precisão FP) mais depressa do que um loop de acumulação em
+            # Python; a negação evita um abs() por elemento
+            amounts = self._expense_amounts
+            total_spent = math.fsum(a for a in amounts if a > 0)
+            total_extra = -math.fsum(a for a in amounts if a < 0)
+            self._agg_cache = (total_spent, total_extra, total_extra > 0)
+        return self._agg_cache
+
     def calculate_totals(self):
         """Calcula totais financeiros"""
-        total_spent = sum(expense['amount'] for expense in self.expenses if expense['amount'] > 0)
-        current_balance = self.salary - total_spent
-        return total_spent, current_balance
+        total_spent, _total_extra, _has_extra = self._aggregate()
+        return total_spent, self.salary - total_spent
 
     def analyze_spending_patterns(self):
-        """Analisa padrões de gastos"""
+        """Analisa padrões de gastos
+
+        O resultado é memoizado em _analysis_cache e invalidado junto com
+        os agregados; a análise corria duas travessias (Counter + soma por
+        descrição) que agora são fundidas numa só, normalizando cada
+        descrição uma única vez.
+        """
         if not self.expenses:
             return [], 0, "", []
 
-        descriptions = [expense['description'].lower().strip() for expense in self.expenses]
-        description_counter = Counter(descriptions)
-        most_common = description_counter.most_common(5)
-
-        expense_by_desc = {}
-        for expense in self.expenses:
-            desc = expense['description'].lower().strip()
-            if desc in expense_by_desc:
-                expense_by_desc[desc] += expense['amount']
-            else:
-                expense_by_desc[desc] = expense['amount']
+        if self._analysis_cache is None:
+            # Itera as listas paralelas (layout SoA): indexação de lista em
+            # vez de dois lookups de dict por despesa, e a normalização da
+            # descrição já foi feita na inserção
+            description_counter = Counter(self._expense_desc_keys)
+            # defaultdict resolve a chave em falta em C — um lookup por
+            # despesa em vez do par "in" + indexação
+            expense_by_desc = defaultdict(float)
+            for desc, amount in zip(self._expense_desc_keys, self._expense_amounts):
+                expense_by_desc[desc] += amount
+
+            most_common = description_counter.most_common(5)
+            highest_spending = max(expense_by_desc.items(), key=lambda x: x[1]) if expense_by_desc else ("", 0)
+            # nlargest percorre a lista uma vez com um heap de 3 elementos,
+            # em vez de ordenar todas as despesas para usar só o topo
+            top_expenses = heapq.nlargest(3, self.expenses, key=itemgetter('amount'))
+            self._analysis_cache = (most_common, highest_spending[1], highest_spending[0], top_expenses)
+
+        return self._analysis_cache
 
-        highest_spending = max(expense_by_desc.items(), key=lambda x: x[1]) if expense_by_desc else ("", 0)
-        top_expenses = sorted(self.expenses, key=lambda x: x['amount'], reverse=True)[:3]
+    def categorize_transactions(self):
+        """Categoriza transações por tipo
 
-        return most_common, highest_spending[1], highest_spending[0], top_expenses
+        Memoizado como os restantes derivados das despesas — o dashboard
+        chama isto em cada construção e o resultado só muda com mutações.
+        """
+        if self._categorize_cache is not None:
+            return self._categorize_cache
 
-    def categorize_transactions(self):
-        """Categoriza transações por tipo"""
         regular_expenses = []
         goal_payments = []
         debt_payments = []
         extra_income = []
+        # Totais por categoria acumulados na mesma passagem — o dashboard
+        # só precisa de os ler, sem voltar a somar os dicts em cada render
+        totals = [0.0, 0.0, 0.0, 0.0]
 
+        # Lê cada campo uma única vez por registo — os dicts são o formato
+        # de persistência, por isso evita-se repetir o hashing das chaves
         for expense in self.expenses:
-            if expense['amount'] < 0:  # Renda extra
+            description = expense['description']
+            amount = expense['amount']
+            if amount < 0:  # Renda extra
                 extra_income.append(expense)
-            elif expense['description'].startswith("💰 Meta:"):
+                totals[3] -= amount
+            elif description.startswith("💰 Meta:"):
                 goal_payments.append(expense)
-            elif expense['description'].startswith("💳 Dívida:"):
+                totals[1] += amount
+            elif description.startswith("💳 Dívida:"):
                 debt_payments.append(expense)
+                totals[2] += amount
             else:
                 regular_expenses.append(expense)
+                totals[0] += amount
 
-        return regular_expenses, goal_payments, debt_payments, extra_income
+        self._categorize_cache = (
+            (regular_expenses, goal_payments, debt_payments, extra_income),
+            tuple(totals),
+        )
+        return self._categorize_cache
 
     def create_mobile_card(self, content, color="#FFFFFF"):
         """Cria card otimizado para mobile"""
         return ft.Container(
             content=content,
             bgcolor=color,
-            border=ft.border.all(1, "#E5E7EB"),
+            border=_BORDER_GRAY,
             border_radius=16,
-            padding=ft.padding.all(16),
-            margin=ft.margin.only(bottom=16),
-            shadow=ft.BoxShadow(
-                spread_radius=0,
-                blur_radius=8,
-                color="#1F293720",
-                offset=ft.Offset(0, 2)
-            )
+            padding=_PADDING_16,
+            margin=_MARGIN_B16,
+            shadow=_CARD_SHADOW
         )
 
     def create_mobile_button(self, text, on_click, icon=None, color="#2563EB"):
         """Cria botão otimizado para mobile"""
+        # Sem placeholder: botões sem ícone não serializam um Container vazio
+        children = []
+        if icon:
+            children.append(ft.Icon(icon, color="#FFFFFF", size=20))
+        children.append(ft.Text(text, color="#FFFFFF", size=14, weight=ft.FontWeight.BOLD))
+
         return ft.Container(
-            content=ft.Row([
-                ft.Icon(icon, color="#FFFFFF", size=20) if icon else ft.Container(),
-                ft.Text(text, color="#FFFFFF", size=14, weight=ft.FontWeight.BOLD)
-            ], alignment=ft.MainAxisAlignment.CENTER, spacing=8),
+            content=ft.Row(children, alignment=ft.MainAxisAlignment.CENTER, spacing=8),
             bgcolor=color,
             border_radius=12,
-            padding=ft.padding.symmetric(vertical=14, horizontal=20),
+            padding=_BUTTON_PADDING,
             on_click=on_click,
-            margin=ft.margin.only(bottom=12),
-            shadow=ft.BoxShadow(
-                spread_radius=0,
-                blur_radius=8,
-                color=f"{color}40",
-                offset=ft.Offset(0, 2)
-            )
+            margin=_MARGIN_B12,
+            shadow=_button_shadow(color)
         )
 
     def create_fixed_header(self):
@@ -227,26 +757,30 @@ class FinancialApp:
             alignment=ft.alignment.center,
             bgcolor="#FFFFFF",
             border=ft.border.only(bottom=ft.BorderSide(1, "#E5E7EB")),
-            shadow=ft.BoxShadow(
-                spread_radius=0,
-                blur_radius=4,
-                color="#1F293720",
-                offset=ft.Offset(0, 2)
-            )
+            shadow=_SOFT_SHADOW
         )
 
     def show_snack_bar(self, message, bgcolor="#059669"):
-        """Método moderno para mostrar notificações"""
+        """Método moderno para mostrar notificações
+
+        Os SnackBars são reutilizados por (mensagem, cor): antes cada
+        notificação acrescentava um control novo ao overlay que nunca era
+        removido, acumulando widgets ao longo da sessão.
+        """
         try:
-            snack_bar = ft.SnackBar(
-                content=ft.Text(message, color="#FFFFFF"),
-                bgcolor=bgcolor,
-                action="OK",
-                action_color="#FFFFFF"
-            )
-            self.page.overlay.append(snack_bar)
+            key = (message, bgcolor)
+            snack_bar = self._snack_bars.get(key)
+            if snack_bar is None:
+                snack_bar = ft.SnackBar(
+                    content=ft.Text(message, color="#FFFFFF"),
+                    bgcolor=bgcolor,
+                    action="OK",
+                    action_color="#FFFFFF"
+                )
+                self._snack_bars[key] = snack_bar
+                self.page.overlay.append(snack_bar)
             snack_bar.open = True
-            self.page.update()
+            self._request_update()
         except Exception as e:
             print(f"Erro ao mostrar snack bar: {e}")
 
@@ -275,52 +809,122 @@ class FinancialApp:
             print(f"Erro ao fechar diálogo: {e}")
             self.dialog_open = False
 
+    @contextmanager
+    def _dialog_guard(self):
+        """Evita diálogos duplicados e garante que a flag não fica presa em True
+
+        Se a construção do diálogo levantar uma exceção, a flag é reposta —
+        caso contrário um erro deixava todos os diálogos bloqueados até
+        reiniciar a app.
+        """
+        if self.dialog_open:
+            print("Diálogo já está aberto")
+            yield False
+            return
+
+        self.dialog_open = True
+        try:
+            yield True
+        except Exception:
+            self.dialog_open = False
+            raise
+
+
+    @contextmanager
+    def _batched_updates(self):
+        """Coalesce vários page.update() num único envio no fim do handler"""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0:
+                self.page.update()
+
+    def _request_update(self):
+        """page.update() imediato, ou adiado até ao fim do lote em curso"""
+        if self._update_depth == 0:
+            self.page.update()
+
+
     def save_salary(self, e):
         """Salva o salário base digitado"""
-        try:
-            salary_value = self.salary_field.content.value
-            if salary_value:
-                self.base_salary = float(salary_value)
+        with self._batched_updates():
+            salary_value = _safe_kz(self.salary_field.content.value)
+            if salary_value is not None:
+                self.base_salary = salary_value
                 self.salary = self.base_salary + self.accumulated_balance
-                self.save_data()
-                self.update_all_views()
+                self._schedule_save('meta')
+                self.update_views_for('meta')
 
                 self.show_snack_bar("💰 Salário salvo!", "#059669")
-        except ValueError:
-            self.show_snack_bar("❌ Valor inválido!", "#DC2626")
+            elif self.salary_field.content.value:
+                self.show_snack_bar("❌ Valor inválido!", "#DC2626")
 
     def create_components(self):
-        """Cria todos os componentes da interface"""
+        """Cria a vista inicial; as restantes são construídas na primeira navegação"""
         self.create_finances_view()
-        self.create_goals_view()
-        self.create_extras_view()
-        self.create_summary_view()
 
-    def create_finances_view(self):
-        """Cria a vista de finanças otimizada para mobile"""
-        # Campo salário
-        self.salary_field = ft.Container(
+        # As outras vistas só são montadas quando o utilizador navega até elas
+        # (update_*_view constrói sob demanda), acelerando o arranque.
+        self.goals_view = None
+        self.extras_view = None
+        self.summary_view = None
+
+    @staticmethod
+    def _make_field(label, focus_color, value="", number=False, on_change=None):
+        """Cria um campo de formulário com o estilo partilhado da app
+
+        Todos os campos das vistas repetiam o mesmo bloco de estilo; um
+        único construtor reduz alocações e mantém o visual num só sítio.
+        """
+        return ft.Container(
             content=ft.TextField(
-                label="💰 Salário Mensal (Kz)",
-                value=str(self.base_salary) if self.base_salary > 0 else "",
-                keyboard_type=ft.KeyboardType.NUMBER,
+                label=label,
+                value=value,
+                keyboard_type=ft.KeyboardType.NUMBER if number else None,
                 bgcolor="#FFFFFF",
                 border_color="#E5E7EB",
-                focused_border_color="#2563EB",
+                focused_border_color=focus_color,
                 border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
+                content_padding=_PADDING_16,
+                text_size=14,
+                on_change=on_change
             ),
-            margin=ft.margin.only(bottom=12)
+            margin=_MARGIN_B12
         )
 
-        # Card resumo financeiro mobile
-        total_spent, current_balance = self.calculate_totals()
+    def create_finances_view(self):
+        """Cria a vista de finanças otimizada para mobile"""
+        # Campo salário
+        self.salary_field = self._make_field(
+            "💰 Salário Mensal (Kz)", "#2563EB",
+            value=str(self.base_salary) if self.base_salary > 0 else "",
+            number=True
+        )
+
+        # Card resumo financeiro mobile — os nós dinâmicos ficam em
+        # atributos para o refresh escrever valores sem reconstruir nada
+        self._fin_month_text = ft.Text("", size=12, color="#6B7280")
+        self._fin_total_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD, color="#2563EB")
+        self._fin_spent_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD, color="#EC4899")
+        self._fin_balance_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD)
+        self._fin_usage_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD, color="#D97706")
+        self._fin_balance_box = ft.Container(
+            content=ft.Column([
+                ft.Text("Saldo", size=10, color="#6B7280"),
+                self._fin_balance_text,
+                ft.Text("Kz", size=9, color="#9CA3AF")
+            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=2),
+            border_radius=12,
+            padding=_PADDING_12,
+            expand=True
+        )
 
         self.summary_card = self.create_mobile_card(
             ft.Column([
                 ft.Text("💎 Resumo Financeiro", size=18, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                ft.Text(f"Mês: {self.current_month}", size=12, color="#6B7280"),
+                self._fin_month_text,
                 ft.Container(height=12),
 
                 # Grid responsivo para mobile
@@ -329,52 +933,40 @@ class FinancialApp:
                         ft.Container(
                             content=ft.Column([
                                 ft.Text("Total", size=10, color="#6B7280"),
-                                ft.Text(f"{self.salary:,.0f}", size=14, weight=ft.FontWeight.BOLD, color="#2563EB"),
+                                self._fin_total_text,
                                 ft.Text("Kz", size=9, color="#9CA3AF")
                             ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=2),
                             bgcolor="#EFF6FF",
                             border_radius=12,
-                            padding=ft.padding.all(12),
+                            padding=_PADDING_12,
                             expand=True
                         ),
                         ft.Container(width=8),
                         ft.Container(
                             content=ft.Column([
                                 ft.Text("Gasto", size=10, color="#6B7280"),
-                                ft.Text(f"{total_spent:,.0f}", size=14, weight=ft.FontWeight.BOLD, color="#EC4899"),
+                                self._fin_spent_text,
                                 ft.Text("Kz", size=9, color="#9CA3AF")
                             ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=2),
                             bgcolor="#FDF2F8",
                             border_radius=12,
-                            padding=ft.padding.all(12),
+                            padding=_PADDING_12,
                             expand=True
                         )
                     ]),
                     ft.Container(height=8),
                     ft.Row([
-                        ft.Container(
-                            content=ft.Column([
-                                ft.Text("Saldo", size=10, color="#6B7280"),
-                                ft.Text(f"{current_balance:,.0f}", size=14, weight=ft.FontWeight.BOLD,
-                                        color="#059669" if current_balance >= 0 else "#DC2626"),
-                                ft.Text("Kz", size=9, color="#9CA3AF")
-                            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=2),
-                            bgcolor="#ECFDF5" if current_balance >= 0 else "#FEF2F2",
-                            border_radius=12,
-                            padding=ft.padding.all(12),
-                            expand=True
-                        ),
+                        self._fin_balance_box,
                         ft.Container(width=8),
                         ft.Container(
                             content=ft.Column([
                                 ft.Text("Uso", size=10, color="#6B7280"),
-                                ft.Text(f"{(total_spent / self.salary * 100):,.0f}%" if self.salary > 0 else "0%",
-                                        size=14, weight=ft.FontWeight.BOLD, color="#D97706"),
+                                self._fin_usage_text,
                                 ft.Text("%", size=9, color="#9CA3AF")
                             ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=2),
                             bgcolor="#FFFBEB",
                             border_radius=12,
-                            padding=ft.padding.all(12),
+                            padding=_PADDING_12,
                             expand=True
                         )
                     ])
@@ -382,10 +974,51 @@ class FinancialApp:
             ])
         )
 
-        # Análise de gastos
+        # Análise de gastos — vive num slot próprio para o refresh poder
+        # trocar apenas este cartão
+        self._fin_analysis_slot = ft.Container(content=self._build_spending_analysis())
+
+
+        # Campos despesa
+        self.expense_description = self._make_field("📝 Descrição da Despesa", "#EC4899")
+
+        self.expense_amount = self._make_field("💵 Valor da Despesa (Kz)", "#EC4899", number=True)
+
+        # Lista despesas mobile
+        self.expenses_list = ft.ListView(
+            spacing=8,
+            height=200,
+            padding=_PADDING_0,
+            # Altura fixa por item permite ao Flutter saltar o layout das
+            # linhas fora do ecrã ("known extents")
+            item_extent=60
+        )
+        # Preenche os nós dinâmicos acabados de criar
+        self._refresh_finances_view()
+
+        # Layout mobile
+        self.finances_view = ft.Column([
+            self.salary_field,
+            self.create_mobile_button("💾 Salvar Salário", self.save_salary, ft.Icons.SAVE, "#2563EB"),
+
+            self.summary_card,
+            self._fin_analysis_slot,
+
+            ft.Text("💸 Nova Despesa", size=18, weight=ft.FontWeight.BOLD, color="#EC4899"),
+            self.expense_description,
+            self.expense_amount,
+            self.create_mobile_button("Adicionar Despesa", self.add_expense, ft.Icons.ADD_CIRCLE, "#EC4899"),
+
+            ft.Text("📋 Últimas Transações", size=18, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            self.create_mobile_card(self.expenses_list)
+
+        ], scroll=ft.ScrollMode.AUTO, spacing=0)
+
+    def _build_spending_analysis(self):
+        """Constrói o cartão de análise de gastos (None sem despesas)"""
         most_common, highest_amount, highest_desc, top_expenses = self.analyze_spending_patterns()
 
-        spending_analysis = self.create_mobile_card(
+        return self.create_mobile_card(
             ft.Column([
                 ft.Text("📊 Análise de Gastos", size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
                 ft.Container(height=12),
@@ -396,17 +1029,17 @@ class FinancialApp:
                                 content=ft.Text("🔥", size=20),
                                 bgcolor="#FEF2F2",
                                 border_radius=25,
-                                padding=ft.padding.all(8)
+                                padding=_PADDING_8
                             ),
                             ft.Text("Maior Gasto", size=11, color="#6B7280", weight=ft.FontWeight.BOLD),
-                            ft.Text(f"{highest_amount:,.0f} Kz", size=14, weight=ft.FontWeight.BOLD, color="#DC2626"),
+                            ft.Text(_fmt_kz(highest_amount), size=14, weight=ft.FontWeight.BOLD, color="#DC2626"),
                             ft.Text(highest_desc.title()[:15] + "..." if len(
                                 highest_desc) > 15 else highest_desc.title() if highest_desc else "N/A",
                                     size=9, color="#9CA3AF")
                         ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=4),
                         bgcolor="#FAFAFA",
                         border_radius=12,
-                        padding=ft.padding.all(12),
+                        padding=_PADDING_12,
                         expand=True
                     ),
                     ft.Container(width=12),
@@ -416,7 +1049,7 @@ class FinancialApp:
                                 content=ft.Text("🎯", size=20),
                                 bgcolor="#FFFBEB",
                                 border_radius=25,
-                                padding=ft.padding.all(8)
+                                padding=_PADDING_8
                             ),
                             ft.Text("Mais Frequente", size=11, color="#6B7280", weight=ft.FontWeight.BOLD),
                             ft.Text(f"{most_common[0][1]}x" if most_common else "0x", size=14,
@@ -428,136 +1061,52 @@ class FinancialApp:
                         ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=4),
                         bgcolor="#FAFAFA",
                         border_radius=12,
-                        padding=ft.padding.all(12),
+                        padding=_PADDING_12,
                         expand=True
                     )
                 ])
             ])
-        ) if self.expenses else ft.Container()
-
-        # Campos despesa
-        self.expense_description = ft.Container(
-            content=ft.TextField(
-                label="📝 Descrição da Despesa",
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#EC4899",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
-
-        self.expense_amount = ft.Container(
-            content=ft.TextField(
-                label="💵 Valor da Despesa (Kz)",
-                keyboard_type=ft.KeyboardType.NUMBER,
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#EC4899",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
-
-        # Lista despesas mobile
-        self.expenses_list = ft.ListView(
-            spacing=8,
-            height=200,
-            padding=ft.padding.all(0)
-        )
-        self.update_expenses_list()
-
-        # Layout mobile
-        self.finances_view = ft.Column([
-            self.salary_field,
-            self.create_mobile_button("💾 Salvar Salário", self.save_salary, ft.Icons.SAVE, "#2563EB"),
-
-            self.summary_card,
-            spending_analysis,
-
-            ft.Text("💸 Nova Despesa", size=18, weight=ft.FontWeight.BOLD, color="#EC4899"),
-            self.expense_description,
-            self.expense_amount,
-            self.create_mobile_button("Adicionar Despesa", self.add_expense, ft.Icons.ADD_CIRCLE, "#EC4899"),
-
-            ft.Text("📋 Últimas Transações", size=18, weight=ft.FontWeight.BOLD, color="#1F2937"),
-            self.create_mobile_card(self.expenses_list)
-
-        ], scroll=ft.ScrollMode.AUTO, spacing=0)
+        ) if self.expenses else None
 
     def create_goals_view(self):
         """Cria a vista de metas otimizada para mobile"""
         _, current_balance = self.calculate_totals()
 
         # Campos meta
-        self.goal_name = ft.Container(
-            content=ft.TextField(
-                label="🎯 Nome da Meta",
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.goal_name = self._make_field("🎯 Nome da Meta", "#059669")
 
-        self.goal_total_cost = ft.Container(
-            content=ft.TextField(
-                label="💎 Custo Total (Kz)",
-                keyboard_type=ft.KeyboardType.NUMBER,
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.goal_total_cost = self._make_field("💎 Custo Total (Kz)", "#059669", number=True)
 
-        self.goal_monthly_saving = ft.Container(
-            content=ft.TextField(
-                label="📅 Guardar por Mês (Kz)",
-                keyboard_type=ft.KeyboardType.NUMBER,
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14,
-                on_change=self.calculate_goal_time
-            ),
-            margin=ft.margin.only(bottom=12)
+        self.goal_monthly_saving = self._make_field(
+            "📅 Guardar por Mês (Kz)", "#059669",
+            number=True, on_change=self.calculate_goal_time
         )
 
         self.goal_time_estimate = ft.Container(
             content=ft.Text("⏱️ Tempo: -- meses", size=14, color="#D97706", weight=ft.FontWeight.BOLD),
             bgcolor="#FFFBEB",
             border_radius=8,
-            padding=ft.padding.all(12),
-            margin=ft.margin.only(bottom=12)
+            padding=_PADDING_12,
+            margin=_MARGIN_B12
         )
 
         # Lista metas
         self.goals_list = ft.ListView(
             spacing=8,
             height=300,
-            padding=ft.padding.all(0)
+            padding=_PADDING_0
         )
         self.update_goals_list()
 
+        self._goals_balance_text = ft.Text(
+            _fmt_kz(current_balance), size=20, weight=ft.FontWeight.BOLD,
+            color=_sign_color(current_balance >= 0))
+
         self.goals_view = ft.Column([
             self.create_mobile_card(
                 ft.Column([
                     ft.Text("💰 Saldo Disponível", size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                    ft.Text(f"{current_balance:,.0f} Kz", size=20, weight=ft.FontWeight.BOLD,
-                            color="#059669" if current_balance >= 0 else "#DC2626"),
+                    self._goals_balance_text,
                     ft.Text("Para investir em suas metas", size=12, color="#6B7280")
                 ])
             ),
@@ -577,121 +1126,29 @@ class FinancialApp:
     def create_extras_view(self):
         """Cria a vista de extras (renda extra + dívidas + dívidas a receber) otimizada para mobile"""
         # Campos renda extra
-        self.extra_income_description = ft.Container(
-            content=ft.TextField(
-                label="💸 Descrição da Renda Extra",
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.extra_income_description = self._make_field("💸 Descrição da Renda Extra", "#059669")
 
-        self.extra_income_amount = ft.Container(
-            content=ft.TextField(
-                label="💰 Valor da Renda (Kz)",
-                keyboard_type=ft.KeyboardType.NUMBER,
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.extra_income_amount = self._make_field("💰 Valor da Renda (Kz)", "#059669", number=True)
 
         # Campos dívida a pagar
-        self.debt_name = ft.Container(
-            content=ft.TextField(
-                label="💳 Nome da Dívida",
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#DC2626",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.debt_name = self._make_field("💳 Nome da Dívida", "#DC2626")
 
-        self.debt_total_amount = ft.Container(
-            content=ft.TextField(
-                label="💰 Valor Total (Kz)",
-                keyboard_type=ft.KeyboardType.NUMBER,
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#DC2626",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.debt_total_amount = self._make_field("💰 Valor Total (Kz)", "#DC2626", number=True)
 
-        self.debt_monthly_payment = ft.Container(
-            content=ft.TextField(
-                label="📅 Pagamento Mensal (Kz)",
-                keyboard_type=ft.KeyboardType.NUMBER,
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#DC2626",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.debt_monthly_payment = self._make_field("📅 Pagamento Mensal (Kz)", "#DC2626", number=True)
 
         # NOVOS CAMPOS: Dívidas a receber
-        self.debt_to_receive_name = ft.Container(
-            content=ft.TextField(
-                label="👤 Quem deve (Nome/Descrição)",
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.debt_to_receive_name = self._make_field("👤 Quem deve (Nome/Descrição)", "#059669")
 
-        self.debt_to_receive_amount = ft.Container(
-            content=ft.TextField(
-                label="💰 Valor da Dívida (Kz)",
-                keyboard_type=ft.KeyboardType.NUMBER,
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.debt_to_receive_amount = self._make_field("💰 Valor da Dívida (Kz)", "#059669", number=True)
 
-        self.debt_to_receive_due_date = ft.Container(
-            content=ft.TextField(
-                label="📅 Data de Vencimento (DD/MM/AAAA)",
-                bgcolor="#FFFFFF",
-                border_color="#E5E7EB",
-                focused_border_color="#059669",
-                border_radius=12,
-                content_padding=ft.padding.all(16),
-                text_size=14
-            ),
-            margin=ft.margin.only(bottom=12)
-        )
+        self.debt_to_receive_due_date = self._make_field("📅 Data de Vencimento (DD/MM/AAAA)", "#059669")
 
         # Lista dívidas a pagar
         self.debts_list = ft.ListView(
             spacing=8,
             height=200,
-            padding=ft.padding.all(0)
+            padding=_PADDING_0
         )
         self.update_debts_list()
 
@@ -699,7 +1156,7 @@ class FinancialApp:
         self.debts_to_receive_list = ft.ListView(
             spacing=8,
             height=200,
-            padding=ft.padding.all(0)
+            padding=_PADDING_0
         )
         self.update_debts_to_receive_list()
 
@@ -740,115 +1197,115 @@ class FinancialApp:
 
         ], scroll=ft.ScrollMode.AUTO, spacing=0)
 
-    def create_summary_view(self):
-        """Cria a vista de resumo otimizada para mobile com categorias"""
-        total_spent, current_balance = self.calculate_totals()
-        regular_expenses, goal_payments, debt_payments, extra_income = self.categorize_transactions()
+    # (título, emoji, cor, índice do resultado de categorize_transactions)
+    _SUMMARY_CATEGORIES = (
+        ("Despesas Regulares", "🛒", "#EC4899", 0),
+        ("Investimentos em Metas", "🎯", "#059669", 1),
+        ("Pagamentos de Dívidas", "💳", "#DC2626", 2),
+        ("Renda Extra", "💰", "#059669", 3),
+    )
 
-        # Calcula total a receber
-        total_to_receive = sum(
-            debt.get('total_amount', 0) - debt.get('received_amount', 0) for debt in self.debts_to_receive)
+    def create_summary_view(self):
+        """Cria o scaffolding do dashboard uma única vez
+
+        Os quatro cartões de estatística guardam referências aos Texts de
+        valor e cada categoria de transações vive num slot próprio; as
+        atualizações seguintes só escrevem valores e trocam conteúdos de
+        slot em _refresh_summary_view.
+        """
+        self._sum_salary_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD, color="#2563EB")
+        self._sum_spent_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD, color="#EC4899")
+        self._sum_balance_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD)
+        self._sum_receive_text = ft.Text("", size=14, weight=ft.FontWeight.BOLD, color="#8B5CF6")
+        self._sum_category_slots = [ft.Container() for _ in self._SUMMARY_CATEGORIES]
 
-        # Cards estatísticas mobile
         stats_cards = ft.Column([
             ft.Row([
-                self.create_stat_card_mobile("💰", "Salário", f"{self.salary:,.0f}", "Kz", "#2563EB"),
+                self.create_stat_card_mobile("💰", "Salário", self._sum_salary_text, "Kz"),
                 ft.Container(width=8),
-                self.create_stat_card_mobile("💸", "Gastos", f"{total_spent:,.0f}", "Kz", "#EC4899")
+                self.create_stat_card_mobile("💸", "Gastos", self._sum_spent_text, "Kz")
             ]),
             ft.Container(height=8),
             ft.Row([
-                self.create_stat_card_mobile("💎", "Saldo", f"{current_balance:,.0f}", "Kz",
-                                             "#059669" if current_balance >= 0 else "#DC2626"),
+                self.create_stat_card_mobile("💎", "Saldo", self._sum_balance_text, "Kz"),
                 ft.Container(width=8),
-                self.create_stat_card_mobile("📥", "A Receber", f"{total_to_receive:,.0f}", "Kz", "#8B5CF6")
+                self.create_stat_card_mobile("📥", "A Receber", self._sum_receive_text, "Kz")
             ])
         ])
 
-        # Função para criar lista de transações
-        def create_transaction_list(transactions, title, icon, color, max_items=3):
-            if not transactions:
-                return ft.Container()
-
-            sorted_transactions = sorted(transactions, key=lambda x: x['amount'], reverse=True)[:max_items]
+        self.summary_view = ft.Column([
+            stats_cards,
+            ft.Container(height=16),
+            *self._sum_category_slots
 
-            return self.create_mobile_card(
-                ft.Column([
-                    ft.Text(f"{icon} {title}", size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                    ft.Container(height=8),
-                    ft.Column([
-                        ft.Row([
-                            ft.Text(f"{i + 1}.", size=12, color="#6B7280", weight=ft.FontWeight.BOLD),
-                            ft.Column([
-                                ft.Text(transaction['description'][:25] + "..." if len(transaction['description']) > 25
-                                        else transaction['description'], size=13, weight=ft.FontWeight.BOLD),
-                                ft.Text(transaction['date'], size=11, color="#6B7280")
-                            ], expand=True, spacing=2),
-                            ft.Text(f"{abs(transaction['amount']):,.0f} Kz", size=13, weight=ft.FontWeight.BOLD,
-                                    color=color)
-                        ]) for i, transaction in enumerate(sorted_transactions)
-                    ], spacing=8),
-                    ft.Container(height=8),
-                    ft.Text(
-                        f"Total: {sum(abs(t['amount']) for t in transactions):,.0f} Kz • {len(transactions)} transações",
-                        size=11, color="#6B7280", weight=ft.FontWeight.BOLD)
-                ])
-            )
+        ], scroll=ft.ScrollMode.AUTO, spacing=0)
 
-        # Cards de transações categorizadas
-        transaction_cards = []
+        self._refresh_summary_view()
 
-        # Despesas regulares
-        if regular_expenses:
-            transaction_cards.append(
-                create_transaction_list(regular_expenses, "Despesas Regulares", "🛒", "#EC4899")
+    def _refresh_summary_view(self):
+        """Escreve os totais atuais no scaffolding do dashboard"""
+        total_spent, current_balance = self.calculate_totals()
+        categorized, category_totals = self.categorize_transactions()
+
+        self._sum_salary_text.value = _fmt_num(self.salary)
+        self._sum_spent_text.value = _fmt_num(total_spent)
+        self._sum_balance_text.value = _fmt_num(current_balance)
+        self._sum_balance_text.color = _sign_color(current_balance >= 0)
+        # Total a receber pré-agregado na última mutação das dívidas
+        self._sum_receive_text.value = _fmt_num(self._total_to_receive)
+
+        for slot, (title, icon, color, idx) in zip(self._sum_category_slots, self._SUMMARY_CATEGORIES):
+            transactions = categorized[idx]
+            slot.content = (
+                self._build_transaction_card(transactions, category_totals[idx], title, icon, color)
+                if transactions else None
             )
 
-        # Pagamentos de metas
-        if goal_payments:
-            transaction_cards.append(
-                create_transaction_list(goal_payments, "Investimentos em Metas", "🎯", "#059669")
-            )
+    def _build_transaction_card(self, transactions, total, title, icon, color, max_items=3):
+        """Constrói o cartão de uma categoria de transações do dashboard"""
+        sorted_transactions = heapq.nlargest(max_items, transactions, key=itemgetter('amount'))
 
-        # Pagamentos de dívidas
-        if debt_payments:
-            transaction_cards.append(
-                create_transaction_list(debt_payments, "Pagamentos de Dívidas", "💳", "#DC2626")
-            )
-
-        # Renda extra
-        if extra_income:
-            transaction_cards.append(
-                create_transaction_list(extra_income, "Renda Extra", "💰", "#059669")
-            )
+        return self.create_mobile_card(
+            ft.Column([
+                ft.Text(f"{icon} {title}", size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
+                ft.Container(height=8),
+                ft.Column([
+                    ft.Row([
+                        ft.Text(f"{i + 1}.", size=12, color="#6B7280", weight=ft.FontWeight.BOLD),
+                        ft.Column([
+                            ft.Text(transaction['description'][:25] + "..." if len(transaction['description']) > 25
+                                    else transaction['description'], size=13, weight=ft.FontWeight.BOLD),
+                            ft.Text(transaction['date'], size=11, color="#6B7280")
+                        ], expand=True, spacing=2),
+                        ft.Text(_fmt_kz(abs(transaction['amount'])), size=13, weight=ft.FontWeight.BOLD,
+                                color=color)
+                    ]) for i, transaction in enumerate(sorted_transactions)
+                ], spacing=8),
+                ft.Container(height=8),
+                ft.Text(
+                    f"Total: {_fmt_kz(total)} • {len(transactions)} transações",
+                    size=11, color="#6B7280", weight=ft.FontWeight.BOLD)
+            ])
+        )
 
-        self.summary_view = ft.Column([
-            stats_cards,
-            ft.Container(height=16),
-            *transaction_cards
+    def create_stat_card_mobile(self, icon, title, value_text, unit):
+        """Cria card de estatística otimizado para mobile
 
-        ], scroll=ft.ScrollMode.AUTO, spacing=0)
-
-    def create_stat_card_mobile(self, icon, title, value, unit, color):
-        """Cria card de estatística otimizado para mobile"""
+        value_text é o ft.Text (já com cor) que as atualizações patcham.
+        """
         return ft.Container(
             content=ft.Column([
                 ft.Text(icon, size=20),
                 ft.Text(title, size=10, color="#6B7280", weight=ft.FontWeight.BOLD),
-                ft.Text(value, size=14, weight=ft.FontWeight.BOLD, color=color),
+                value_text,
                 ft.Text(unit, size=9, color="#9CA3AF") if unit else ft.Container(height=8)
             ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=4),
             bgcolor="#FFFFFF",
-            border=ft.border.all(1, "#E5E7EB"),
+            border=_BORDER_GRAY,
             border_radius=12,
-            padding=ft.padding.all(12),
+            padding=_PADDING_12,
             expand=True,
-            shadow=ft.BoxShadow(
-                spread_radius=0,
-                blur_radius=4,
-                color="#1F293720",
-                offset=ft.Offset(0, 2)
-            )
+            shadow=_SOFT_SHADOW
         )
 
     def setup_layout(self):
@@ -878,12 +1335,7 @@ class FinancialApp:
             ),
             bgcolor="#FFFFFF",
             border=ft.border.only(top=ft.BorderSide(1, "#E5E7EB")),
-            shadow=ft.BoxShadow(
-                spread_radius=0,
-                blur_radius=8,
-                color="#1F293720",
-                offset=ft.Offset(0, -2)
-            ),
+            shadow=_NAV_SHADOW,
             height=80
         )
 
@@ -956,18 +1408,18 @@ class FinancialApp:
             "📊 Dashboard"
         ]
 
-        if hasattr(self, 'header_text'):
+        if self.header_text is not None:
             self.header_text.value = headers[new_index]
 
         # Atualiza o índice selecionado na navegação
-        if hasattr(self, 'navigation_bar'):
+        if self.navigation_bar is not None:
             nav_bar = self.navigation_bar.content
             nav_bar.selected_index = new_index
 
         # Atualiza o conteúdo
         self.update_content_for_current_view()
 
-        self.page.update()
+        self._request_update()
 
     def navigation_changed(self, e):
         """Gerencia navegação pelos botões"""
@@ -982,456 +1434,286 @@ class FinancialApp:
             "📊 Dashboard"
         ]
 
-        if hasattr(self, 'header_text'):
+        if self.header_text is not None:
             self.header_text.value = headers[selected_index]
 
         # Atualiza o conteúdo
         self.update_content_for_current_view()
 
-        self.page.update()
+        self._request_update()
 
     def update_content_for_current_view(self):
-        """Atualiza o conteúdo baseado na view atual"""
-        # Primeiro atualiza a view
-        if self.current_view_index == 0:
-            self.update_finances_view()
-            new_content = self.finances_view
-        elif self.current_view_index == 1:
-            self.update_goals_view()
-            new_content = self.goals_view
-        elif self.current_view_index == 2:
-            self.update_extras_view()
-            new_content = self.extras_view
-        elif self.current_view_index == 3:
-            self.update_summary_view()
-            new_content = self.summary_view
-
-        # Atualiza o conteúdo no container
-        if hasattr(self, 'content_container'):
-            self.content_container.content.content = new_content
-        """Diálogo centralizado que se adapta ao teclado"""
-        print(f"Abrindo diálogo para meta {goal_index}")
-
-        # Evita múltiplas chamadas
-        if self.dialog_open:
-            print("Diálogo já está aberto")
-            return
+        """Coloca a view atual no ecrã, atualizando-a apenas se estiver suja"""
+        index = self.current_view_index
+        view = (self.finances_view, self.goals_view,
+                self.extras_view, self.summary_view)[index]
+
+        if view is None or self._view_dirty[index]:
+            self._view_updaters[index]()
+            self._view_dirty[index] = False
+        else:
+            # Os dados não mudaram desde a última visita: basta trocar
+            self._show_view_if_current(index, view)
+
+    def show_add_payment_dialog(self, goal_index):
+        """Abre o diálogo de investimento numa meta"""
+        self.show_payment_dialog('goal', goal_index)
+
+    def show_pay_debt_dialog(self, debt_index):
+        """Abre o diálogo de pagamento de uma dívida"""
+        self.show_payment_dialog('debt', debt_index)
+
+    def show_payment_dialog(self, kind, index):
+        """Diálogo centralizado de pagamento, partilhado entre metas e dívidas"""
+        with self._dialog_guard() as ok:
+            if not ok:
+                return
+            self._open_payment_dialog(kind, index)
+
+    def _open_payment_dialog(self, kind, index):
+        """Prepara e abre o diálogo de pagamento (chamado sob _dialog_guard)
+
+        O diálogo é construído uma única vez; cada abertura só escreve os
+        textos e cores do tema ativo nos nós já existentes, sem recriar a
+        subárvore nem novas closures.
+        """
+        theme = PAYMENT_DIALOG_THEMES[kind]
+        print(f"Abrindo diálogo de {theme['label']} {index}")
 
-        self.dialog_open = True
         _, current_balance = self.calculate_totals()
 
-        # Verifica se a meta existe
-        if goal_index >= len(self.goals):
-            print(f"Erro: Meta {goal_index} não existe")
+        items = getattr(self, theme['list_attr'])
+
+        # Verifica se o item existe
+        if index >= len(items):
+            print(f"Erro: {theme['label']} {index} não existe")
             self.dialog_open = False
             return
 
-        payment_field = ft.TextField(
-            label="Valor do Pagamento (Kz)",
-            keyboard_type=ft.KeyboardType.NUMBER,
-            bgcolor="#FFFFFF",
-            border_color="#E5E7EB",
-            focused_border_color="#059669",
+        item = items[index]
+
+        refs = self._payment_dialog_refs
+        if refs is None:
+            refs = self._payment_dialog_refs = self._build_payment_dialog()
+
+        # Estado ativo lido pelos handlers vinculados
+        self._payment_kind = kind
+        self._payment_index = index
+        self._payment_balance = current_balance
+
+        accent = theme['accent']
+        refs['title_icon'].name = theme['icon']
+        refs['title_icon'].color = accent
+        refs['title_text'].value = theme['title']
+        refs['item_text'].value = f"{theme['emoji']} {item['name']}"
+        refs['total_text'].value = _fmt_num(item[theme['total_key']])
+        refs['paid_label'].value = theme['paid_label']
+        refs['paid_text'].value = _fmt_num(item[theme['paid_key']])
+        refs['paid_text'].color = accent
+        refs['balance_text'].value = _fmt_num(current_balance)
+        refs['info_card'].bgcolor = theme['card_bgcolor']
+        refs['info_card'].border = ft.border.all(1, theme['card_border'])
+        refs['field'].value = ""
+        refs['field'].focused_border_color = accent
+        refs['error_text'].value = ""
+        refs['confirm_button'].text = theme['button_text']
+        refs['confirm_button'].bgcolor = accent
+
+        # page.open já faz o update — o update extra duplicava a viagem IPC
+        self._active_dialog = refs['dialog']
+        self.page.open(refs['dialog'])
+
+        print(f"Diálogo centralizado aberto para {theme['label']} {index}")
+
+    def _build_payment_dialog(self):
+        """Constrói o diálogo de pagamento reutilizável e guarda as referências"""
+        refs = {
+            'title_icon': ft.Icon(None, size=22),
+            'title_text': ft.Text("", size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            'item_text': ft.Text("", size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            'total_text': ft.Text("", size=12, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            'paid_label': ft.Text("", size=10, color="#6B7280"),
+            'paid_text': ft.Text("", size=12, weight=ft.FontWeight.BOLD),
+            'balance_text': ft.Text("", size=12, weight=ft.FontWeight.BOLD, color="#2563EB"),
+            'field': ft.TextField(
+                label="Valor do Pagamento (Kz)",
+                keyboard_type=ft.KeyboardType.NUMBER,
+                bgcolor="#FFFFFF",
+                border_color="#E5E7EB",
+                border_radius=12,
+                content_padding=_PADDING_16,
+                text_size=14,
+                autofocus=True
+            ),
+            'error_text': ft.Text("", size=12, color="#DC2626"),
+            'confirm_button': ft.ElevatedButton(
+                "",
+                on_click=self._confirm_payment_action,
+                color="#FFFFFF",
+                style=_CONFIRM_BUTTON_STYLE
+            )
+        }
+        refs['info_card'] = ft.Container(
+            content=ft.Column([
+                refs['item_text'],
+                ft.Container(height=8),
+                ft.Row([
+                    ft.Column([
+                        ft.Text("Total", size=10, color="#6B7280"),
+                        refs['total_text'],
+                        ft.Text("Kz", size=9, color="#9CA3AF")
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
+                    ft.Column([
+                        refs['paid_label'],
+                        refs['paid_text'],
+                        ft.Text("Kz", size=9, color="#9CA3AF")
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
+                    ft.Column([
+                        ft.Text("Disponível", size=10, color="#6B7280"),
+                        refs['balance_text'],
+                        ft.Text("Kz", size=9, color="#9CA3AF")
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
+                ], alignment=ft.MainAxisAlignment.SPACE_AROUND)
+            ]),
             border_radius=12,
-            content_padding=ft.padding.all(16),
-            text_size=14,
-            autofocus=True
+            padding=_PADDING_16,
+            margin=_MARGIN_B16
         )
-
-        error_text = ft.Text("", size=12, color="#DC2626")
-
-        def add_payment_action(e):
-            print(f"Processando pagamento para meta {goal_index}")
-            try:
-                if not payment_field.value or payment_field.value.strip() == "":
-                    error_text.value = "❌ Digite um valor!"
-                    self.page.update()
-                    return
-
-                amount = float(payment_field.value.strip())
-                if amount <= 0:
-                    error_text.value = "❌ Valor deve ser maior que zero!"
-                    self.page.update()
-                    return
-
-                if amount > current_balance:
-                    error_text.value = f"❌ Saldo insuficiente! Disponível: {current_balance:,.0f} Kz"
-                    self.page.update()
-                    return
-
-                # Adiciona pagamento à meta
-                if 'saved_amount' not in self.goals[goal_index]:
-                    self.goals[goal_index]['saved_amount'] = 0
-                self.goals[goal_index]['saved_amount'] += amount
-
-                # Adiciona como despesa
-                payment_expense = {
-                    'description': f"💰 Meta: {self.goals[goal_index]['name']}",
-                    'amount': amount,
-                    'date': datetime.now().strftime("%d/%m/%Y")
-                }
-                self.expenses.append(payment_expense)
-
-                self.save_data()
-
-                # Fecha diálogo usando método CORRETO do Flet
-                try:
-                    if hasattr(self.page, 'close'):
-                        self.page.close(dialog)  # Método moderno
-                    else:
-                        dialog.open = False
-                        self.page.update()
-                    self.dialog_open = False
-                except Exception as dialog_ex:
-                    print(f"Erro ao fechar diálogo: {dialog_ex}")
-                    dialog.open = False
-                    self.dialog_open = False
-                    self.page.update()
-
-                # Atualiza views
-                self.update_all_views()
-
-                # Mostra sucesso
-                self.show_snack_bar("💰 Investimento realizado com sucesso!", "#059669")
-
-                print(f"Pagamento de {amount} realizado com sucesso para meta {goal_index}")
-
-            except ValueError:
-                error_text.value = "❌ Valor inválido! Use apenas números."
-                self.page.update()
-            except Exception as ex:
-                print(f"Erro ao processar pagamento: {ex}")
-                error_text.value = f"❌ Erro: {str(ex)}"
-                self.page.update()
-
-        def close_dialog_action(e):
-            """Handler para fechar diálogo de meta"""
-            try:
-                print("Fechando diálogo de meta")
-                if hasattr(self.page, 'close'):
-                    self.page.close(dialog)  # Método moderno
-                else:
-                    dialog.open = False
-                    self.page.update()
-                self.dialog_open = False
-            except Exception as ex:
-                print(f"Erro ao fechar diálogo de meta: {ex}")
-                dialog.open = False
-                self.dialog_open = False
-                self.page.update()
-
         # Diálogo centralizado e responsivo ao teclado
-        dialog = ft.AlertDialog(
+        refs['dialog'] = ft.AlertDialog(
             modal=True,
             title=ft.Row([
-                ft.Icon(ft.Icons.SAVINGS, color="#059669", size=22),
-                ft.Text("Investir na Meta", size=16, weight=ft.FontWeight.BOLD, color="#1F2937")
+                refs['title_icon'],
+                refs['title_text']
             ], spacing=8, alignment=ft.MainAxisAlignment.CENTER),
             content=ft.Container(
                 content=ft.Column([
-                    # Card com informações compactas
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Text(f"🎯 {self.goals[goal_index]['name']}",
-                                    size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                            ft.Container(height=8),
-                            ft.Row([
-                                ft.Column([
-                                    ft.Text("Total", size=10, color="#6B7280"),
-                                    ft.Text(f"{self.goals[goal_index]['total_cost']:,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                                    ft.Text("Kz", size=9, color="#9CA3AF")
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
-                                ft.Column([
-                                    ft.Text("Investido", size=10, color="#6B7280"),
-                                    ft.Text(f"{self.goals[goal_index].get('saved_amount', 0):,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#059669"),
-                                    ft.Text("Kz", size=9, color="#9CA3AF")
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
-                                ft.Column([
-                                    ft.Text("Disponível", size=10, color="#6B7280"),
-                                    ft.Text(f"{current_balance:,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#2563EB"),
-                                    ft.Text("Kz", size=9, color="#9CA3AF")
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
-                            ], alignment=ft.MainAxisAlignment.SPACE_AROUND)
-                        ]),
-                        bgcolor="#F8FAFC",
-                        border_radius=12,
-                        padding=ft.padding.all(16),
-                        border=ft.border.all(1, "#E2E8F0"),
-                        margin=ft.margin.only(bottom=16)
-                    ),
-
-                    # Campo de input
-                    payment_field,
-
+                    refs['info_card'],
+                    refs['field'],
                     ft.Container(height=8),
-
-                    # Texto de erro
-                    error_text
-
+                    refs['error_text']
                 ], tight=True, spacing=0),
                 width=300,  # Largura fixa para mobile
-                padding=ft.padding.all(4)
+                padding=_PADDING_4
             ),
             actions=[
                 ft.Row([
                     ft.TextButton(
                         "Cancelar",
-                        on_click=close_dialog_action,
-                        style=ft.ButtonStyle(
-                            color="#6B7280",
-                            overlay_color="#F3F4F6"
-                        )
+                        on_click=self._close_dialog,
+                        style=_CANCEL_BUTTON_STYLE
                     ),
-                    ft.ElevatedButton(
-                        "💰 Investir",
-                        on_click=add_payment_action,
-                        bgcolor="#059669",
-                        color="#FFFFFF",
-                        style=ft.ButtonStyle(
-                            shape=ft.RoundedRectangleBorder(radius=8)
-                        )
-                    )
+                    refs['confirm_button']
                 ], alignment=ft.MainAxisAlignment.END, spacing=8)
             ],
             actions_alignment=ft.MainAxisAlignment.END,
             # Propriedades para adaptação ao teclado
-            content_padding=ft.padding.all(0),
-            title_padding=ft.padding.all(20),
-            actions_padding=ft.padding.symmetric(horizontal=20, vertical=16),
-            shape=ft.RoundedRectangleBorder(radius=16),
+            content_padding=_PADDING_0,
+            title_padding=_PADDING_20,
+            actions_padding=_DIALOG_ACTIONS_PADDING,
+            shape=_DIALOG_SHAPE,
             # Garante que o diálogo se move com o teclado
             bgcolor="#FFFFFF",
             surface_tint_color="#FFFFFF"
         )
+        return refs
 
-        # Método moderno para abrir diálogo centralizado
-        self.page.open(dialog)
-
-        # Força um update para garantir posicionamento correto
-        self.page.update()
+    def _close_dialog(self, e=None):
+        """Fecha o diálogo atualmente aberto
 
-        print(f"Diálogo centralizado aberto para meta {goal_index}")
-
-    def show_pay_debt_dialog(self, debt_index):
-        """Diálogo centralizado para pagar dívida"""
-        print(f"Abrindo diálogo para dívida {debt_index}")
-
-        # Evita múltiplas chamadas
-        if self.dialog_open:
-            print("Diálogo já está aberto")
+        Método vinculado uma única vez — os botões Cancelar deixam de criar
+        uma closure por abertura de diálogo.
+        """
+        dialog = self._active_dialog
+        if dialog is None:
             return
-
-        self.dialog_open = True
-        _, current_balance = self.calculate_totals()
-
-        # Verifica se a dívida existe
-        if debt_index >= len(self.debts):
-            print(f"Erro: Dívida {debt_index} não existe")
+        try:
+            if hasattr(self.page, 'close'):
+                self.page.close(dialog)  # Método moderno
+            else:
+                dialog.open = False
+                self.page.update()
             self.dialog_open = False
-            return
-
-        payment_field = ft.TextField(
-            label="Valor do Pagamento (Kz)",
-            keyboard_type=ft.KeyboardType.NUMBER,
-            bgcolor="#FFFFFF",
-            border_color="#E5E7EB",
-            focused_border_color="#DC2626",
-            border_radius=12,
-            content_padding=ft.padding.all(16),
-            text_size=14,
-            autofocus=True
-        )
-
-        error_text = ft.Text("", size=12, color="#DC2626")
-
-        def pay_debt_action(e):
-            print(f"Processando pagamento para dívida {debt_index}")
-            try:
-                if not payment_field.value or payment_field.value.strip() == "":
-                    error_text.value = "❌ Digite um valor!"
-                    self.page.update()
-                    return
-
-                amount = float(payment_field.value.strip())
-                if amount <= 0:
-                    error_text.value = "❌ Valor deve ser maior que zero!"
-                    self.page.update()
-                    return
-
-                if amount > current_balance:
-                    error_text.value = f"❌ Saldo insuficiente! Disponível: {current_balance:,.0f} Kz"
-                    self.page.update()
-                    return
-
-                # Adiciona pagamento à dívida
-                if 'paid_amount' not in self.debts[debt_index]:
-                    self.debts[debt_index]['paid_amount'] = 0
-                self.debts[debt_index]['paid_amount'] += amount
-
-                # Adiciona como despesa
-                debt_expense = {
-                    'description': f"💳 Dívida: {self.debts[debt_index]['name']}",
-                    'amount': amount,
-                    'date': datetime.now().strftime("%d/%m/%Y")
-                }
-                self.expenses.append(debt_expense)
-
-                self.save_data()
+        except Exception as ex:
+            print(f"Erro ao fechar diálogo: {ex}")
+            dialog.open = False
+            self.dialog_open = False
+            self.page.update()
 
-                # Fecha diálogo usando método CORRETO do Flet
-                try:
-                    if hasattr(self.page, 'close'):
-                        self.page.close(dialog)  # Método moderno
-                    else:
-                        dialog.open = False
-                        self.page.update()
-                    self.dialog_open = False
-                except Exception as dialog_ex:
-                    print(f"Erro ao fechar diálogo: {dialog_ex}")
-                    dialog.open = False
-                    self.dialog_open = False
-                    self.page.update()
-
-                # Atualiza views
-                self.update_all_views()
-
-                # Mostra sucesso
-                self.show_snack_bar("💳 Pagamento realizado com sucesso!", "#DC2626")
-
-                print(f"Pagamento de {amount} realizado com sucesso para dívida {debt_index}")
+    def _confirm_payment_action(self, e):
+        """Processa o pagamento do diálogo reutilizável"""
+        theme = PAYMENT_DIALOG_THEMES[self._payment_kind]
+        index = self._payment_index
+        refs = self._payment_dialog_refs
+        payment_field = refs['field']
+        error_text = refs['error_text']
+        current_balance = self._payment_balance
+        print(f"Processando pagamento para {theme['label']} {index}")
+        try:
+            if not payment_field.value or payment_field.value.strip() == "":
+                error_text.value = "❌ Digite um valor!"
+                self.page.update()
+                return
 
-            except ValueError:
+            amount = _safe_kz(payment_field.value)
+            if amount is None:
                 error_text.value = "❌ Valor inválido! Use apenas números."
                 self.page.update()
-            except Exception as ex:
-                print(f"Erro ao processar pagamento: {ex}")
-                error_text.value = f"❌ Erro: {str(ex)}"
+                return
+
+            if amount <= 0:
+                error_text.value = "❌ Valor deve ser maior que zero!"
                 self.page.update()
+                return
 
-        def close_dialog_action(e):
-            """Handler para fechar diálogo de dívida"""
-            try:
-                print("Fechando diálogo de dívida")
-                if hasattr(self.page, 'close'):
-                    self.page.close(dialog)  # Método moderno
-                else:
-                    dialog.open = False
-                    self.page.update()
-                self.dialog_open = False
-            except Exception as ex:
-                print(f"Erro ao fechar diálogo de dívida: {ex}")
-                dialog.open = False
-                self.dialog_open = False
+            if amount > current_balance:
+                error_text.value = f"❌ Saldo insuficiente! Disponível: {_fmt_kz(current_balance)}"
                 self.page.update()
+                return
 
-        # Diálogo centralizado e responsivo ao teclado
-        dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Row([
-                ft.Icon(ft.Icons.PAYMENT, color="#DC2626", size=22),
-                ft.Text("Pagar Dívida", size=16, weight=ft.FontWeight.BOLD, color="#1F2937")
-            ], spacing=8, alignment=ft.MainAxisAlignment.CENTER),
-            content=ft.Container(
-                content=ft.Column([
-                    # Card com informações compactas
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Text(f"💳 {self.debts[debt_index]['name']}",
-                                    size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                            ft.Container(height=8),
-                            ft.Row([
-                                ft.Column([
-                                    ft.Text("Total", size=10, color="#6B7280"),
-                                    ft.Text(f"{self.debts[debt_index]['total_amount']:,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                                    ft.Text("Kz", size=9, color="#9CA3AF")
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
-                                ft.Column([
-                                    ft.Text("Pago", size=10, color="#6B7280"),
-                                    ft.Text(f"{self.debts[debt_index].get('paid_amount', 0):,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#DC2626"),
-                                    ft.Text("Kz", size=9, color="#9CA3AF")
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
-                                ft.Column([
-                                    ft.Text("Disponível", size=10, color="#6B7280"),
-                                    ft.Text(f"{current_balance:,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#2563EB"),
-                                    ft.Text("Kz", size=9, color="#9CA3AF")
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
-                            ], alignment=ft.MainAxisAlignment.SPACE_AROUND)
-                        ]),
-                        bgcolor="#FEF2F2",
-                        border_radius=12,
-                        padding=ft.padding.all(16),
-                        border=ft.border.all(1, "#FECACA"),
-                        margin=ft.margin.only(bottom=16)
-                    ),
+            # Adiciona pagamento ao item
+            item = getattr(self, theme['list_attr'])[index]
+            item[theme['paid_key']] += amount
 
-                    # Campo de input
-                    payment_field,
+            # Adiciona como despesa
+            payment_expense = {
+                'description': f"{theme['desc_prefix']}{item['name']}",
+                'amount': amount,
+                'date': self._today()
+            }
+            self._append_expense(payment_expense)
 
-                    ft.Container(height=8),
+            self._schedule_save(theme['list_attr'], 'expenses')
 
-                    # Texto de erro
-                    error_text
+            self._close_dialog()
 
-                ], tight=True, spacing=0),
-                width=300,  # Largura fixa para mobile
-                padding=ft.padding.all(4)
-            ),
-            actions=[
-                ft.Row([
-                    ft.TextButton(
-                        "Cancelar",
-                        on_click=close_dialog_action,
-                        style=ft.ButtonStyle(
-                            color="#6B7280",
-                            overlay_color="#F3F4F6"
-                        )
-                    ),
-                    ft.ElevatedButton(
-                        "💳 Pagar",
-                        on_click=pay_debt_action,
-                        bgcolor="#DC2626",
-                        color="#FFFFFF",
-                        style=ft.ButtonStyle(
-                            shape=ft.RoundedRectangleBorder(radius=8)
-                        )
-                    )
-                ], alignment=ft.MainAxisAlignment.END, spacing=8)
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-            # Propriedades para adaptação ao teclado
-            content_padding=ft.padding.all(0),
-            title_padding=ft.padding.all(20),
-            actions_padding=ft.padding.symmetric(horizontal=20, vertical=16),
-            shape=ft.RoundedRectangleBorder(radius=16),
-            # Garante que o diálogo se move com o teclado
-            bgcolor="#FFFFFF",
-            surface_tint_color="#FFFFFF"
-        )
+            # Atualiza views
+            self.update_views_for(theme['list_attr'], 'expenses')
 
-        # Método moderno para abrir diálogo centralizado
-        self.page.open(dialog)
+            # Mostra sucesso
+            self.show_snack_bar(theme['success_message'], theme['accent'])
 
-        # Força um update para garantir posicionamento correto
-        self.page.update()
+            print(f"Pagamento de {amount} realizado com sucesso para {theme['label']} {index}")
 
-        print(f"Diálogo centralizado aberto para dívida {debt_index}")
+        except Exception as ex:
+            print(f"Erro ao processar pagamento: {ex}")
+            error_text.value = f"❌ Erro: {str(ex)}"
+            self.page.update()
 
     def show_receive_payment_dialog(self, debt_to_receive_index):
         """Diálogo para receber pagamento de dívida"""
-        print(f"Abrindo diálogo para receber pagamento da dívida {debt_to_receive_index}")
+        with self._dialog_guard() as ok:
+            if not ok:
+                return
+            self._open_receive_payment_dialog(debt_to_receive_index)
 
-        # Evita múltiplas chamadas
-        if self.dialog_open:
-            print("Diálogo já está aberto")
-            return
+    def _open_receive_payment_dialog(self, debt_to_receive_index):
+        """Prepara e abre o diálogo de recebimento (chamado sob _dialog_guard)
 
-        self.dialog_open = True
+        Tal como o diálogo de pagamento, é construído uma única vez; cada
+        abertura só escreve os valores da dívida nos nós existentes.
+        """
+        print(f"Abrindo diálogo para receber pagamento da dívida {debt_to_receive_index}")
 
         # Verifica se a dívida existe
         if debt_to_receive_index >= len(self.debts_to_receive):
@@ -1439,114 +1721,55 @@ class FinancialApp:
             self.dialog_open = False
             return
 
-        payment_field = ft.TextField(
-            label="Valor Recebido (Kz)",
-            keyboard_type=ft.KeyboardType.NUMBER,
-            bgcolor="#FFFFFF",
-            border_color="#E5E7EB",
-            focused_border_color="#059669",
-            border_radius=12,
-            content_padding=ft.padding.all(16),
-            text_size=14,
-            autofocus=True
-        )
-
-        error_text = ft.Text("", size=12, color="#DC2626")
-
-        def receive_payment_action(e):
-            print(f"Processando recebimento para dívida {debt_to_receive_index}")
-            try:
-                if not payment_field.value or payment_field.value.strip() == "":
-                    error_text.value = "❌ Digite um valor!"
-                    self.page.update()
-                    return
-
-                amount = float(payment_field.value.strip())
-                if amount <= 0:
-                    error_text.value = "❌ Valor deve ser maior que zero!"
-                    self.page.update()
-                    return
-
-                debt = self.debts_to_receive[debt_to_receive_index]
-                received_amount = debt.get('received_amount', 0)
-                remaining = debt['total_amount'] - received_amount
-
-                if amount > remaining:
-                    error_text.value = f"❌ Valor maior que o restante da dívida! Máximo: {remaining:,.0f} Kz"
-                    self.page.update()
-                    return
-
-                # Adiciona pagamento à dívida a receber
-                if 'received_amount' not in self.debts_to_receive[debt_to_receive_index]:
-                    self.debts_to_receive[debt_to_receive_index]['received_amount'] = 0
-                self.debts_to_receive[debt_to_receive_index]['received_amount'] += amount
-
-                # IMPORTANTE: Adiciona o valor ao saldo atual
-                self.accumulated_balance += amount
-                self.salary = self.base_salary + self.accumulated_balance
-
-                # Adiciona como renda extra nas transações
-                payment_income = {
-                    'description': f"💸 Recebido: {self.debts_to_receive[debt_to_receive_index]['name']}",
-                    'amount': -amount,  # Negativo para indicar entrada de dinheiro
-                    'date': datetime.now().strftime("%d/%m/%Y")
-                }
-                self.expenses.append(payment_income)
+        debt = self.debts_to_receive[debt_to_receive_index]
+        received_amount = debt['received_amount']
+        remaining = debt['total_amount'] - received_amount
 
-                self.save_data()
+        refs = self._receive_dialog_refs
+        if refs is None:
+            refs = self._receive_dialog_refs = self._build_receive_dialog()
 
-                # Fecha diálogo
-                try:
-                    if hasattr(self.page, 'close'):
-                        self.page.close(dialog)
-                    else:
-                        dialog.open = False
-                        self.page.update()
-                    self.dialog_open = False
-                except Exception as dialog_ex:
-                    print(f"Erro ao fechar diálogo: {dialog_ex}")
-                    dialog.open = False
-                    self.dialog_open = False
-                    self.page.update()
-
-                # Atualiza views
-                self.update_all_views()
-
-                # Mostra sucesso
-                self.show_snack_bar("💸 Pagamento recebido com sucesso!", "#059669")
-
-                print(f"Recebimento de {amount} realizado com sucesso para dívida {debt_to_receive_index}")
+        # Índice ativo lido pelo handler vinculado
+        self._receive_index = debt_to_receive_index
 
-            except ValueError:
-                error_text.value = "❌ Valor inválido! Use apenas números."
-                self.page.update()
-            except Exception as ex:
-                print(f"Erro ao processar recebimento: {ex}")
-                error_text.value = f"❌ Erro: {str(ex)}"
-                self.page.update()
+        refs['item_text'].value = f"💸 {debt['name']}"
+        refs['total_text'].value = _fmt_num(debt['total_amount'])
+        refs['received_text'].value = _fmt_num(received_amount)
+        refs['remaining_text'].value = _fmt_num(remaining)
+        refs['due_text'].value = f"📅 Vencimento: {debt.get('due_date', 'N/A')}"
+        refs['field'].value = ""
+        refs['error_text'].value = ""
 
-        def close_dialog_action(e):
-            """Handler para fechar diálogo de recebimento"""
-            try:
-                print("Fechando diálogo de recebimento")
-                if hasattr(self.page, 'close'):
-                    self.page.close(dialog)
-                else:
-                    dialog.open = False
-                    self.page.update()
-                self.dialog_open = False
-            except Exception as ex:
-                print(f"Erro ao fechar diálogo de recebimento: {ex}")
-                dialog.open = False
-                self.dialog_open = False
-                self.page.update()
+        # Método moderno para abrir diálogo centralizado;
+        # page.open já faz o update
+        self._active_dialog = refs['dialog']
+        self.page.open(refs['dialog'])
 
-        debt = self.debts_to_receive[debt_to_receive_index]
-        received_amount = debt.get('received_amount', 0)
-        remaining = debt['total_amount'] - received_amount
+        print(f"Diálogo de recebimento aberto para dívida {debt_to_receive_index}")
 
+    def _build_receive_dialog(self):
+        """Constrói o diálogo de recebimento reutilizável e guarda as referências"""
+        refs = {
+            'item_text': ft.Text("", size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            'total_text': ft.Text("", size=12, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            'received_text': ft.Text("", size=12, weight=ft.FontWeight.BOLD, color="#059669"),
+            'remaining_text': ft.Text("", size=12, weight=ft.FontWeight.BOLD, color="#DC2626"),
+            'due_text': ft.Text("", size=11, color="#6B7280"),
+            'field': ft.TextField(
+                label="Valor Recebido (Kz)",
+                keyboard_type=ft.KeyboardType.NUMBER,
+                bgcolor="#FFFFFF",
+                border_color="#E5E7EB",
+                focused_border_color="#059669",
+                border_radius=12,
+                content_padding=_PADDING_16,
+                text_size=14,
+                autofocus=True
+            ),
+            'error_text': ft.Text("", size=12, color="#DC2626")
+        }
         # Diálogo centralizado
-        dialog = ft.AlertDialog(
+        refs['dialog'] = ft.AlertDialog(
             modal=True,
             title=ft.Row([
                 ft.Icon(ft.Icons.ARROW_DOWNWARD, color="#059669", size=22),
@@ -1557,582 +1780,867 @@ class FinancialApp:
                     # Card com informações compactas
                     ft.Container(
                         content=ft.Column([
-                            ft.Text(f"💸 {debt['name']}",
-                                    size=16, weight=ft.FontWeight.BOLD, color="#1F2937"),
+                            refs['item_text'],
                             ft.Container(height=8),
                             ft.Row([
                                 ft.Column([
                                     ft.Text("Total", size=10, color="#6B7280"),
-                                    ft.Text(f"{debt['total_amount']:,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#1F2937"),
+                                    refs['total_text'],
                                     ft.Text("Kz", size=9, color="#9CA3AF")
                                 ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
                                 ft.Column([
                                     ft.Text("Recebido", size=10, color="#6B7280"),
-                                    ft.Text(f"{received_amount:,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#059669"),
+                                    refs['received_text'],
                                     ft.Text("Kz", size=9, color="#9CA3AF")
                                 ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
                                 ft.Column([
                                     ft.Text("Restante", size=10, color="#6B7280"),
-                                    ft.Text(f"{remaining:,.0f}",
-                                            size=12, weight=ft.FontWeight.BOLD, color="#DC2626"),
+                                    refs['remaining_text'],
                                     ft.Text("Kz", size=9, color="#9CA3AF")
                                 ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=1),
                             ], alignment=ft.MainAxisAlignment.SPACE_AROUND),
                             ft.Container(height=8),
-                            ft.Text(f"📅 Vencimento: {debt.get('due_date', 'N/A')}",
-                                    size=11, color="#6B7280")
+                            refs['due_text']
                         ]),
                         bgcolor="#F0FDF4",
                         border_radius=12,
-                        padding=ft.padding.all(16),
+                        padding=_PADDING_16,
                         border=ft.border.all(1, "#BBF7D0"),
-                        margin=ft.margin.only(bottom=16)
+                        margin=_MARGIN_B16
                     ),
-
-                    # Campo de input
-                    payment_field,
-
+                    refs['field'],
                     ft.Container(height=8),
-
-                    # Texto de erro
-                    error_text
-
+                    refs['error_text']
                 ], tight=True, spacing=0),
                 width=300,
-                padding=ft.padding.all(4)
+                padding=_PADDING_4
             ),
             actions=[
                 ft.Row([
                     ft.TextButton(
                         "Cancelar",
-                        on_click=close_dialog_action,
-                        style=ft.ButtonStyle(
-                            color="#6B7280",
-                            overlay_color="#F3F4F6"
-                        )
+                        on_click=self._close_dialog,
+                        style=_CANCEL_BUTTON_STYLE
                     ),
                     ft.ElevatedButton(
                         "💸 Receber",
-                        on_click=receive_payment_action,
+                        on_click=self._confirm_receive_action,
                         bgcolor="#059669",
                         color="#FFFFFF",
-                        style=ft.ButtonStyle(
-                            shape=ft.RoundedRectangleBorder(radius=8)
-                        )
+                        style=_CONFIRM_BUTTON_STYLE
                     )
                 ], alignment=ft.MainAxisAlignment.END, spacing=8)
             ],
             actions_alignment=ft.MainAxisAlignment.END,
-            content_padding=ft.padding.all(0),
-            title_padding=ft.padding.all(20),
-            actions_padding=ft.padding.symmetric(horizontal=20, vertical=16),
-            shape=ft.RoundedRectangleBorder(radius=16),
+            content_padding=_PADDING_0,
+            title_padding=_PADDING_20,
+            actions_padding=_DIALOG_ACTIONS_PADDING,
+            shape=_DIALOG_SHAPE,
             bgcolor="#FFFFFF",
             surface_tint_color="#FFFFFF"
         )
+        return refs
+
+    def _confirm_receive_action(self, e):
+        """Processa o recebimento do diálogo reutilizável"""
+        debt_to_receive_index = self._receive_index
+        refs = self._receive_dialog_refs
+        payment_field = refs['field']
+        error_text = refs['error_text']
+        print(f"Processando recebimento para dívida {debt_to_receive_index}")
+        try:
+            if not payment_field.value or payment_field.value.strip() == "":
+                error_text.value = "❌ Digite um valor!"
+                self.page.update()
+                return
 
-        # Método moderno para abrir diálogo centralizado
-        self.page.open(dialog)
-        self.page.update()
+            amount = _safe_kz(payment_field.value)
+            if amount is None:
+                error_text.value = "❌ Valor inválido! Use apenas números."
+                self.page.update()
+                return
 
-        print(f"Diálogo de recebimento aberto para dívida {debt_to_receive_index}")
+            if amount <= 0:
+                error_text.value = "❌ Valor deve ser maior que zero!"
+                self.page.update()
+                return
 
-    def navigation_changed(self, e):
-        """Gerencia navegação e atualiza header"""
-        selected_index = e.control.selected_index
-        self.current_view_index = selected_index
+            debt = self.debts_to_receive[debt_to_receive_index]
+            received_amount = debt['received_amount']
+            remaining = debt['total_amount'] - received_amount
 
-        # Atualiza header usando referência direta
-        headers = [
-            "💳 Controle Financeiro",
-            "🎯 Metas & Objetivos",
-            "💰 Extras & Dívidas",
-            "📊 Dashboard"
-        ]
+            if amount > remaining:
+                error_text.value = f"❌ Valor maior que o restante da dívida! Máximo: {_fmt_kz(remaining)}"
+                self.page.update()
+                return
 
-        if hasattr(self, 'header_text'):
-            self.header_text.value = headers[selected_index]
+            # Adiciona pagamento à dívida a receber
+            debt['received_amount'] += amount
+            self._sync_receivable_arrays()
+
+            # IMPORTANTE: Adiciona o valor ao saldo atual
+            self.accumulated_balance += amount
+            self.salary = self.base_salary + self.accumulated_balance
+
+            # Adiciona como renda extra nas transações
+            payment_income = {
+                'description': f"💸 Recebido: {debt['name']}",
+                'amount': -amount,  # Negativo para indicar entrada de dinheiro
+                'date': self._today()
+            }
+            self._append_expense(payment_income)
+
+            self._schedule_save('meta', 'debts_to_receive', 'expenses')
+
+            # Fecha diálogo
+            self._close_dialog()
+
+            # Atualiza views
+            self.update_views_for('meta', 'debts_to_receive', 'expenses')
 
-        # Atualiza conteúdo
-        if selected_index == 0:
-            self.content_container.content = self.finances_view
-            self.update_finances_view()
-        elif selected_index == 1:
-            self.content_container.content = self.goals_view
-            self.update_goals_view()
-        elif selected_index == 2:
-            self.content_container.content = self.extras_view
-            self.update_extras_view()
-        elif selected_index == 3:
-            self.content_container.content = self.summary_view
-            self.update_summary_view()
-
-        self.page.update()
+            # Mostra sucesso
+            self.show_snack_bar("💸 Pagamento recebido com sucesso!", "#059669")
+
+            print(f"Recebimento de {amount} realizado com sucesso para dívida {debt_to_receive_index}")
+
+        except Exception as ex:
+            print(f"Erro ao processar recebimento: {ex}")
+            error_text.value = f"❌ Erro: {str(ex)}"
+            self.page.update()
 
     def add_extra_income(self, e):
         """Adiciona renda extra"""
-        description_field = self.extra_income_description.content
-        amount_field = self.extra_income_amount.content
+        with self._batched_updates():
+            description_field = self.extra_income_description.content
+            amount_field = self.extra_income_amount.content
 
-        if not description_field.value or not amount_field.value:
-            self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
-            return
+            if not description_field.value or not amount_field.value:
+                self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
+                return
 
-        try:
-            amount = float(amount_field.value)
+            amount = _safe_kz(amount_field.value)
+            if amount is None:
+                self.show_snack_bar("❌ Valor inválido!", "#DC2626")
+                return
 
-            self.accumulated_balance += amount
-            self.salary = self.base_salary + self.accumulated_balance
+            try:
+                self.accumulated_balance += amount
+                self.salary = self.base_salary + self.accumulated_balance
 
-            income_entry = {
-                'description': f"💰 {description_field.value}",
-                'amount': -amount,  # Negativo para mostrar como entrada
-                'date': datetime.now().strftime("%d/%m/%Y")
-            }
+                income_entry = {
+                    'description': f"💰 {description_field.value}",
+                    'amount': -amount,  # Negativo para mostrar como entrada
+                    'date': self._today()
+                }
 
-            self.expenses.append(income_entry)
-            self.save_data()
+                self._append_expense(income_entry)
+                self._schedule_save('meta', 'expenses')
 
-            description_field.value = ""
-            amount_field.value = ""
+                description_field.value = ""
+                amount_field.value = ""
 
-            self.update_all_views()
+                self.update_views_for('meta', 'expenses')
 
-            self.show_snack_bar("💰 Renda adicionada!", "#059669")
-        except ValueError:
-            self.show_snack_bar("❌ Valor inválido!", "#DC2626")
+                self.show_snack_bar("💰 Renda adicionada!", "#059669")
+            except ValueError:
+                self.show_snack_bar("❌ Valor inválido!", "#DC2626")
 
     def add_expense(self, e):
         """Adiciona despesa"""
-        description_field = self.expense_description.content
-        amount_field = self.expense_amount.content
+        with self._batched_updates():
+            description_field = self.expense_description.content
+            amount_field = self.expense_amount.content
 
-        if not description_field.value or not amount_field.value:
-            self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
-            return
+            if not description_field.value or not amount_field.value:
+                self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
+                return
 
-        try:
-            amount = float(amount_field.value)
-            expense = {
-                'description': description_field.value,
-                'amount': amount,
-                'date': datetime.now().strftime("%d/%m/%Y")
-            }
+            amount = _safe_kz(amount_field.value)
+            if amount is None:
+                self.show_snack_bar("❌ Valor inválido!", "#DC2626")
+                return
 
-            self.expenses.append(expense)
-            self.save_data()
+            try:
+                expense = {
+                    'description': description_field.value,
+                    'amount': amount,
+                    'date': self._today()
+                }
 
-            description_field.value = ""
-            amount_field.value = ""
+                self._append_expense(expense)
+                self._schedule_save('expenses')
 
-            self.update_all_views()
+                description_field.value = ""
+                amount_field.value = ""
 
-            self.show_snack_bar("💸 Despesa adicionada!", "#EC4899")
-        except ValueError:
-            self.show_snack_bar("❌ Valor inválido!", "#DC2626")
+                self.update_views_for('expenses')
+
+                self.show_snack_bar("💸 Despesa adicionada!", "#EC4899")
+            except ValueError:
+                self.show_snack_bar("❌ Valor inválido!", "#DC2626")
 
     def add_goal(self, e):
         """Adiciona meta"""
-        name_field = self.goal_name.content
-        total_cost_field = self.goal_total_cost.content
-        monthly_saving_field = self.goal_monthly_saving.content
+        with self._batched_updates():
+            name_field = self.goal_name.content
+            total_cost_field = self.goal_total_cost.content
+            monthly_saving_field = self.goal_monthly_saving.content
 
-        if not all([name_field.value, total_cost_field.value, monthly_saving_field.value]):
-            self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
-            return
+            if not all([name_field.value, total_cost_field.value, monthly_saving_field.value]):
+                self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
+                return
+
+            total_cost = _safe_kz(total_cost_field.value)
+            monthly_saving = _safe_kz(monthly_saving_field.value)
+            if total_cost is None or monthly_saving is None:
+                self.show_snack_bar("❌ Valores inválidos!", "#DC2626")
+                return
 
-        try:
             goal = {
+                'id': uuid.uuid4().hex,
                 'name': name_field.value,
-                'total_cost': float(total_cost_field.value),
-                'monthly_saving': float(monthly_saving_field.value),
+                'total_cost': total_cost,
+                'monthly_saving': monthly_saving,
                 'saved_amount': 0,
-                'created_date': datetime.now().strftime("%d/%m/%Y")
+                'created_date': self._today()
             }
 
             self.goals.append(goal)
-            self.save_data()
+            self._schedule_save('goals')
 
             name_field.value = ""
             total_cost_field.value = ""
             monthly_saving_field.value = ""
             self.goal_time_estimate.content.value = "⏱️ Tempo: -- meses"
 
-            self.update_all_views()
+            self.update_views_for('goals')
 
             self.show_snack_bar("🎯 Meta criada!", "#059669")
-        except ValueError:
-            self.show_snack_bar("❌ Valores inválidos!", "#DC2626")
 
     def add_debt(self, e):
         """Adiciona dívida"""
-        name_field = self.debt_name.content
-        total_field = self.debt_total_amount.content
-        monthly_field = self.debt_monthly_payment.content
+        with self._batched_updates():
+            name_field = self.debt_name.content
+            total_field = self.debt_total_amount.content
+            monthly_field = self.debt_monthly_payment.content
 
-        if not all([name_field.value, total_field.value, monthly_field.value]):
-            self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
-            return
+            if not all([name_field.value, total_field.value, monthly_field.value]):
+                self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
+                return
+
+            total_amount = _safe_kz(total_field.value)
+            monthly_payment = _safe_kz(monthly_field.value)
+            if total_amount is None or monthly_payment is None:
+                self.show_snack_bar("❌ Valores inválidos!", "#DC2626")
+                return
 
-        try:
             debt = {
+                'id': uuid.uuid4().hex,
                 'name': name_field.value,
-                'total_amount': float(total_field.value),
-                'monthly_payment': float(monthly_field.value),
+                'total_amount': total_amount,
+                'monthly_payment': monthly_payment,
                 'paid_amount': 0,
-                'created_date': datetime.now().strftime("%d/%m/%Y")
+                'created_date': self._today()
             }
 
             self.debts.append(debt)
-            self.save_data()
+            self._schedule_save('debts')
 
             name_field.value = ""
             total_field.value = ""
             monthly_field.value = ""
 
-            self.update_all_views()
+            self.update_views_for('debts')
 
             self.show_snack_bar("💳 Dívida adicionada!", "#DC2626")
-        except ValueError:
-            self.show_snack_bar("❌ Valores inválidos!", "#DC2626")
 
     def add_debt_to_receive(self, e):
         """Adiciona dívida a receber"""
-        name_field = self.debt_to_receive_name.content
-        amount_field = self.debt_to_receive_amount.content
-        due_date_field = self.debt_to_receive_due_date.content
+        with self._batched_updates():
+            name_field = self.debt_to_receive_name.content
+            amount_field = self.debt_to_receive_amount.content
+            due_date_field = self.debt_to_receive_due_date.content
 
-        if not all([name_field.value, amount_field.value, due_date_field.value]):
-            self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
-            return
+            if not all([name_field.value, amount_field.value, due_date_field.value]):
+                self.show_snack_bar("❌ Preencha todos os campos!", "#DC2626")
+                return
+
+            total_amount = _safe_kz(amount_field.value)
+            if total_amount is None:
+                self.show_snack_bar("❌ Valores inválidos!", "#DC2626")
+                return
 
-        try:
             debt_to_receive = {
+                'id': uuid.uuid4().hex,
                 'name': name_field.value,
-                'total_amount': float(amount_field.value),
+                'total_amount': total_amount,
                 'due_date': due_date_field.value,
                 'received_amount': 0,
-                'created_date': datetime.now().strftime("%d/%m/%Y")
+                'created_date': self._today()
             }
 
             self.debts_to_receive.append(debt_to_receive)
-            self.save_data()
+            self._sync_receivable_arrays()
+            self._schedule_save('debts_to_receive')
 
             name_field.value = ""
             amount_field.value = ""
             due_date_field.value = ""
 
-            self.update_all_views()
+            self.update_views_for('debts_to_receive')
 
             self.show_snack_bar("💸 Dívida a receber adicionada!", "#059669")
-        except ValueError:
-            self.show_snack_bar("❌ Valores inválidos!", "#DC2626")
+
+    # Pausa de digitação antes de recalcular a estimativa da meta
+    _GOAL_TIME_DEBOUNCE_SECONDS = 0.15
 
     def calculate_goal_time(self, e):
-        """Calcula tempo da meta"""
+        """Recalcula a estimativa depois de uma pausa na digitação
+
+        O on_change dispara a cada tecla; cada recalculo imediato custava
+        um page.update por dígito. O timer é rearmado por tecla e só o
+        último dispara.
+        """
+        if self._goal_time_timer is not None:
+            self._goal_time_timer.cancel()
+        self._goal_time_timer = threading.Timer(
+            self._GOAL_TIME_DEBOUNCE_SECONDS, self._run_goal_time_estimate)
+        self._goal_time_timer.daemon = True
+        self._goal_time_timer.start()
+
+    def _run_goal_time_estimate(self):
+        """Calcula tempo da meta e atualiza apenas o widget da estimativa"""
         total_cost_field = self.goal_total_cost.content
         monthly_saving_field = self.goal_monthly_saving.content
 
-        try:
-            if total_cost_field.value and monthly_saving_field.value:
-                total_cost = float(total_cost_field.value)
-                monthly_saving = float(monthly_saving_field.value)
-
-                if monthly_saving > 0:
-                    months = math.ceil(total_cost / monthly_saving)
-                    self.goal_time_estimate.content.value = f"⏱️ Tempo: {months} meses"
-                else:
-                    self.goal_time_estimate.content.value = "⏱️ Tempo: -- meses"
+        if total_cost_field.value and monthly_saving_field.value:
+            total_cost = _safe_kz(total_cost_field.value)
+            monthly_saving = _safe_kz(monthly_saving_field.value)
 
-                self.page.update()
-        except ValueError:
-            self.goal_time_estimate.content.value = "⏱️ Tempo: -- meses"
-            self.page.update()
-
-    def remove_expense(self, index):
-        """Remove despesa"""
+            if total_cost is not None and monthly_saving is not None and monthly_saving > 0:
+                # Teto inteiro sem math.ceil nem divisão em float
+                months = (total_cost + monthly_saving - 1) // monthly_saving
+                estimate = f"⏱️ Tempo: {months} meses"
+            else:
+                estimate = "⏱️ Tempo: -- meses"
+
+            # Só viaja até ao renderer quando a estimativa muda de facto
+            if estimate != self.goal_time_estimate.content.value:
+                self.goal_time_estimate.content.value = estimate
+                # Update dirigido ao control — não serializa a página toda
+                self.goal_time_estimate.update()
+
+    def _today(self):
+        """Data de hoje formatada, cacheada até o dia mudar
+
+        Os handlers carimbam registos a cada clique; strftime é
+        suficientemente caro para não valer a pena repeti-lo.
+        """
+        today = date.today()
+        if self._today_date != today:
+            self._today_date = today
+            self._today_str = today.strftime("%d/%m/%Y")
+        return self._today_str
+
+    @staticmethod
+    def _index_by_id(items, item_id):
+        """Índice atual de um registo pela sua id estável (ou None)"""
+        for i, item in enumerate(items):
+            if item.get('id') == item_id:
+                return i
+        return None
+
+
+    def _on_invest_click(self, e):
+        """Handler único do botão investir; a id da meta vem em control.data"""
+        print(f"Clique no botão investir para meta {e.control.data}")
+        goal_index = self._index_by_id(self.goals, e.control.data)
+        if goal_index is not None:
+            self.show_add_payment_dialog(goal_index)
+
+    def _on_remove_goal_click(self, e):
+        """Remove a meta cuja id vem em control.data"""
+        gid = e.control.data
+        goal_index = self._index_by_id(self.goals, gid)
+        try:
+            if goal_index is not None:
+                with self._batched_updates():
+                    self.goals.pop(goal_index)
+                    self._goal_card_cache.pop(gid, None)
+                    # Reconstrói a lista a partir do cache (barato) — além de
+                    # retirar o cartão, invalida a geração para que um lote
+                    # diferido em curso não acrescente o cartão apagado
+                    self.update_goals_list()
+                    self._schedule_save('goals')
+
+                    self.show_snack_bar("🗑️ Meta removida!", "#DC2626")
+        except Exception as ex:
+            print(f"Erro ao remover meta: {ex}")
+
+    def _on_pay_debt_click(self, e):
+        """Handler único do botão pagar; a id da dívida vem em control.data"""
+        print(f"Clique no botão pagar para dívida {e.control.data}")
+        debt_index = self._index_by_id(self.debts, e.control.data)
+        if debt_index is not None:
+            self.show_pay_debt_dialog(debt_index)
+
+    def _on_remove_debt_click(self, e):
+        """Remove a dívida cuja id vem em control.data"""
+        did = e.control.data
+        debt_index = self._index_by_id(self.debts, did)
+        try:
+            if debt_index is not None:
+                with self._batched_updates():
+                    self.debts.pop(debt_index)
+                    self._debt_card_cache.pop(did, None)
+                    # Reconstrói a lista a partir do cache (barato) — além de
+                    # retirar o cartão, invalida a geração para que um lote
+                    # diferido em curso não acrescente o cartão apagado
+                    self.update_debts_list()
+                    self._schedule_save('debts')
+
+                    self.show_snack_bar("🗑️ Dívida removida!", "#DC2626")
+        except Exception as ex:
+            print(f"Erro ao remover dívida: {ex}")
+
+    def _on_receive_click(self, e):
+        """Handler único do botão receber; a id da dívida vem em control.data"""
+        print(f"Clique no botão receber para dívida {e.control.data}")
+        debt_index = self._index_by_id(self.debts_to_receive, e.control.data)
+        if debt_index is not None:
+            self.show_receive_payment_dialog(debt_index)
+
+    def _on_remove_receivable_click(self, e):
+        """Remove a dívida a receber cuja id vem em control.data"""
+        debt_index = self._index_by_id(self.debts_to_receive, e.control.data)
+        try:
+            if debt_index is not None:
+                with self._batched_updates():
+                    self.debts_to_receive.pop(debt_index)
+                    self._sync_receivable_arrays()
+                    # Retira apenas a linha afetada; as restantes continuam
+                    # válidas porque os handlers resolvem por id
+                    if debt_index < len(self.debts_to_receive_list.controls):
+                        self.debts_to_receive_list.controls.pop(debt_index)
+                    # O dashboard mostra o total a receber; fica para a navegação
+                    self._view_dirty[3] = True
+                    self._schedule_save('debts_to_receive')
+
+                    self.show_snack_bar("🗑️ Dívida a receber removida!", "#DC2626")
+        except Exception as ex:
+            print(f"Erro ao remover dívida a receber: {ex}")
 
-        def remove(e):
-            try:
-                if index < len(self.expenses):
-                    self.expenses.pop(index)
-                    self.save_data()
-                    self.update_all_views()
+    def _on_remove_expense_click(self, e):
+        """Remove a transação cujo id estável vem em control.data"""
+        index = self._index_by_id(self.expenses, e.control.data)
+        try:
+            if index is not None:
+                with self._batched_updates():
+                    expense = self.expenses.pop(index)
+                    self._expense_amounts.pop(index)
+                    self._expense_desc_keys.pop(index)
+                    self._expense_row_cache.pop(expense.get('id'), None)
+                    # Remoções são raras; reconstruir a janela é o caminho simples
+                    self._recent_expenses = deque(self.expenses[-10:], maxlen=10)
+                    self._invalidate_caches()
+                    self._schedule_save('expenses')
+                    self.update_views_for('expenses')
 
                     self.show_snack_bar("🗑️ Transação removida!", "#DC2626")
-            except Exception as ex:
-                print(f"Erro ao remover despesa: {ex}")
+        except Exception as ex:
+            print(f"Erro ao remover despesa: {ex}")
 
-        return remove
 
     def update_expenses_list(self):
-        """Atualiza lista de despesas"""
+        """Atualiza lista de despesas reutilizando as linhas já construídas
+
+        As linhas são imutáveis depois de criadas (descrição, valor e data
+        não mudam), por isso só as despesas novas geram controls; o resto
+        sai do cache por id.
+        """
         self.expenses_list.controls.clear()
 
-        for i, expense in enumerate(reversed(self.expenses[-10:])):  # Últimas 10
-            is_income = expense['amount'] < 0
-            is_goal_payment = expense['description'].startswith("💰 Meta:")
-            is_debt_payment = expense['description'].startswith("💳 Dívida:")
-
-            # Escolhe ícone e cor
-            if is_income:
-                icon = ft.Icons.ARROW_UPWARD
-                color = "#059669"
-                bg_color = "#ECFDF5"
-            elif is_goal_payment:
-                icon = ft.Icons.SAVINGS
-                color = "#059669"
-                bg_color = "#ECFDF5"
-            elif is_debt_payment:
-                icon = ft.Icons.PAYMENT
-                color = "#DC2626"
-                bg_color = "#FEF2F2"
+        seen_ids = set()
+        for expense in reversed(self._recent_expenses):  # Últimas 10
+            eid = expense.get('id')
+            seen_ids.add(eid)
+            row = self._expense_row_cache.get(eid)
+            if row is None:
+                row = self._build_expense_row(expense)
+                if eid is not None:
+                    self._expense_row_cache[eid] = row
+            self.expenses_list.controls.append(row)
+
+        # Linhas removidas ou fora da janela não ficam retidas no cache
+        for eid in list(self._expense_row_cache):
+            if eid not in seen_ids:
+                del self._expense_row_cache[eid]
+
+    def _build_expense_row(self, expense):
+        """Constrói uma linha da lista de transações"""
+        description = expense['description']
+        if expense['amount'] < 0:
+            kind = 'income'
+        elif description.startswith("💰 Meta:"):
+            kind = 'goal'
+        elif description.startswith("💳 Dívida:"):
+            kind = 'debt'
+        else:
+            kind = 'expense'
+        icon, color, bg_color = _EXPENSE_ROW_STYLES[kind]
+
+        # Strings de exibição pré-calculadas na inserção
+        desc_s = expense['_display_desc']
+        amount_s = expense['_display_amount']
+
+        return ft.Container(
+            content=ft.Row([
+                ft.Container(
+                    content=ft.Icon(icon, color=color, size=16),
+                    bgcolor=bg_color,
+                    border_radius=20,
+                    padding=_PADDING_8
+                ),
+                ft.Column([
+                    ft.Text(desc_s, size=12, weight=ft.FontWeight.NORMAL, color="#1F2937"),
+                    ft.Text(expense['date'], size=10, color="#6B7280")
+                ], expand=True, spacing=2),
+                ft.Column([
+                    ft.Text(amount_s, size=12, weight=ft.FontWeight.BOLD, color=color),
+                    ft.IconButton(
+                        icon=ft.Icons.DELETE_OUTLINE,
+                        icon_color="#DC2626",
+                        icon_size=14,
+                        data=expense.get('id'),
+                        on_click=self._on_remove_expense_click,
+                        tooltip="Remover"
+                    )
+                ], horizontal_alignment=ft.CrossAxisAlignment.END, spacing=0)
+            ]),
+            bgcolor="#FFFFFF",
+            border=_BORDER_LIGHT,
+            border_radius=8,
+            padding=_PADDING_8
+        )
+
+    # Cartões construídos de forma síncrona por atualização; o resto é
+    # diferido e construído em lotes entre frames
+    _INLINE_BUILD_LIMIT = 8
+    _BUILD_BATCH_SIZE = 5
+
+    def _schedule_card_builds(self, key, list_view, cache, build_fn, refresh_fn, pending):
+        """Constrói os cartões restantes em lotes entre frames para não travar a UI"""
+        generation = self._card_build_generation.get(key, 0)
+
+        def _build_one(index, item):
+            iid = item.get('id')
+            refs = cache.get(iid)
+            if refs is None:
+                refs = build_fn(index, item)
+                if iid is not None:
+                    cache[iid] = refs
             else:
-                icon = ft.Icons.ARROW_DOWNWARD
-                color = "#EC4899"
-                bg_color = "#FDF2F8"
+                refresh_fn(refs, index, item)
+            return refs
+
+        async def _build_batches():
+            for start in range(0, len(pending), self._BUILD_BATCH_SIZE):
+                if self._card_build_generation.get(key) != generation:
+                    return  # uma atualização mais recente tomou conta da lista
+                for index, item in pending[start:start + self._BUILD_BATCH_SIZE]:
+                    list_view.controls.append(_build_one(index, item)['container'])
+                # O update é cosmético: se a lista ainda não está montada
+                # (a navegação corre em paralelo), os controls já ficaram em
+                # controls e o próximo update da página apanha-os — não se
+                # abandona a construção dos restantes cartões
+                try:
+                    list_view.update()
+                except Exception:
+                    pass
+                await asyncio.sleep(0)
+
+        try:
+            self.page.run_task(_build_batches)
+        except Exception:
+            # Sem suporte a tarefas async — constrói tudo de forma síncrona
+            for index, item in pending:
+                list_view.controls.append(_build_one(index, item)['container'])
 
-            expense_item = ft.Container(
-                content=ft.Row([
-                    ft.Container(
-                        content=ft.Icon(icon, color=color, size=16),
-                        bgcolor=bg_color,
-                        border_radius=20,
-                        padding=ft.padding.all(8)
-                    ),
-                    ft.Column([
-                        ft.Text(expense['description'][:30] + "..." if len(expense['description']) > 30
-                                else expense['description'],
-                                size=12, weight=ft.FontWeight.NORMAL, color="#1F2937"),
-                        ft.Text(expense['date'], size=10, color="#6B7280")
-                    ], expand=True, spacing=2),
-                    ft.Column([
-                        ft.Text(f"{abs(expense['amount']):,.0f} Kz", size=12, weight=ft.FontWeight.BOLD, color=color),
-                        ft.IconButton(
-                            icon=ft.Icons.DELETE_OUTLINE,
-                            icon_color="#DC2626",
-                            icon_size=14,
-                            on_click=self.remove_expense(len(self.expenses) - 1 - i),
-                            tooltip="Remover"
-                        )
-                    ], horizontal_alignment=ft.CrossAxisAlignment.END, spacing=0)
-                ]),
-                bgcolor="#FFFFFF",
-                border=ft.border.all(1, "#F3F4F6"),
-                border_radius=8,
-                padding=ft.padding.all(8),
-                margin=ft.margin.only(bottom=4)
-            )
-            self.expenses_list.controls.append(expense_item)
 
     def update_goals_list(self):
-        """Atualiza lista de metas"""
+        """Atualiza lista de metas reutilizando os cartões já construídos"""
         self.goals_list.controls.clear()
+        self._card_build_generation['goals'] = self._card_build_generation.get('goals', 0) + 1
 
+        seen_ids = set()
+        pending = []  # cartões ainda por construir, diferidos para lotes
+        built_inline = 0
         for i, goal in enumerate(self.goals):
-            saved_amount = goal.get('saved_amount', 0)
-            progress = saved_amount / goal['total_cost'] if goal['total_cost'] > 0 else 0
-            remaining = goal['total_cost'] - saved_amount
-
-            # Status da meta
-            if progress >= 1.0:
-                status_text = "✅ Concluída!"
-                status_color = "#059669"
-                can_invest = False
-            elif progress >= 0.75:
-                status_text = f"🔥 Quase lá!"
-                status_color = "#D97706"
-                can_invest = True
+            gid = goal.get('id')
+            seen_ids.add(gid)
+            refs = self._goal_card_cache.get(gid)
+            # Depois do primeiro diferido, tudo é diferido para manter a ordem
+            if pending or (refs is None and built_inline >= self._INLINE_BUILD_LIMIT):
+                pending.append((i, goal))
+                continue
+            if refs is None:
+                built_inline += 1
+                refs = self._build_goal_card(i, goal)
+                if gid is not None:
+                    self._goal_card_cache[gid] = refs
             else:
-                status_text = f"💰 Faltam {remaining:,.0f} Kz"
-                status_color = "#6B7280"
-                can_invest = True
-
-            # Função para criar handler de clique seguro
-            def create_invest_click_handler(goal_index):
-                def handle_invest_click(e):
-                    print(f"Clique no botão investir para meta {goal_index}")
-                    self.show_add_payment_dialog(goal_index)
-
-                return handle_invest_click
-
-            # Função para criar handler de remoção seguro
-            def create_remove_click_handler(goal_index):
-                def handle_remove_click(e):
-                    try:
-                        if goal_index < len(self.goals):
-                            self.goals.pop(goal_index)
-                            self.save_data()
-                            self.update_all_views()
-
-                            self.show_snack_bar("🗑️ Meta removida!", "#DC2626")
-                    except Exception as ex:
-                        print(f"Erro ao remover meta: {ex}")
-
-                return handle_remove_click
-
-            # Botão de investir
+                self._refresh_goal_card(refs, i, goal)
+            self.goals_list.controls.append(refs['container'])
+
+        if pending:
+            self._schedule_card_builds('goals', self.goals_list, self._goal_card_cache,
+                                       self._build_goal_card, self._refresh_goal_card, pending)
+
+        # Descarta cartões de metas entretanto removidas
+        for gid in list(self._goal_card_cache):
+            if gid not in seen_ids:
+                del self._goal_card_cache[gid]
+
+    def _build_goal_card(self, index, goal):
+        """Constrói um cartão de meta e guarda as referências aos nós mutáveis"""
+        refs = {
+            'name_text': ft.Text(goal['name'], size=14, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            'status_text': ft.Text("", size=11),
+            'remove_button': ft.IconButton(
+                icon=ft.Icons.DELETE_OUTLINE,
+                icon_color="#DC2626",
+                icon_size=16,
+                tooltip="Remover meta"
+            ),
+            'progress_bar': ft.ProgressBar(value=0, bgcolor="#E5E7EB", color="#2563EB", height=6),
+            'range_text': ft.Text("", size=11, color="#6B7280"),
+            'pct_text': ft.Text("", size=11, weight=ft.FontWeight.BOLD, color="#2563EB"),
+            'action_slot': ft.Container(),
+            'can_invest': None
+        }
+        refs['container'] = ft.Container(
+            content=ft.Column([
+                ft.Row([
+                    ft.Column([refs['name_text'], refs['status_text']], expand=True, spacing=2),
+                    refs['remove_button']
+                ]),
+                ft.Container(height=8),
+                refs['progress_bar'],
+                ft.Container(height=8),
+                ft.Row([refs['range_text'], refs['pct_text']], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                ft.Container(height=8),
+                refs['action_slot']
+            ]),
+            bgcolor="#FFFFFF",
+            border=_BORDER_GRAY,
+            border_radius=12,
+            padding=_PADDING_12,
+            margin=_MARGIN_B8
+        )
+        self._refresh_goal_card(refs, index, goal)
+        return refs
+
+    def _refresh_goal_card(self, refs, index, goal, _fmt=_fmt_num, _min=min):
+        """Escreve os valores atuais da meta no cartão existente
+
+        _fmt/_min são ligados na definição: nos refreshes em massa poupa
+        uma pesquisa global por cartão.
+        """
+        saved_amount = goal['saved_amount']
+        progress = saved_amount / goal['total_cost'] if goal['total_cost'] > 0 else 0
+        remaining = goal['total_cost'] - saved_amount
+
+        # Status da meta
+        if progress >= 1.0:
+            status_text = "✅ Concluída!"
+            status_color = "#059669"
+            can_invest = False
+        elif progress >= 0.75:
+            status_text = "🔥 Quase lá!"
+            status_color = "#D97706"
+            can_invest = True
+        else:
+            status_text = f"💰 Faltam {_fmt(remaining)} Kz"
+            status_color = "#6B7280"
+            can_invest = True
+
+        refs['name_text'].value = goal['name']
+        refs['status_text'].value = status_text
+        refs['status_text'].color = status_color
+        refs['progress_bar'].value = _min(progress, 1.0)
+        refs['progress_bar'].color = "#059669" if progress >= 1.0 else "#2563EB"
+        refs['range_text'].value = f"{_fmt(saved_amount)} / {_fmt(goal['total_cost'])} Kz"
+        refs['pct_text'].value = f"{progress * 100:.0f}%"
+
+        refs['remove_button'].data = goal.get('id')
+        refs['remove_button'].on_click = self._on_remove_goal_click
+
+        # O slot de ação só é reconstruído quando o estado muda
+        if can_invest != refs['can_invest']:
+            refs['can_invest'] = can_invest
             if can_invest:
-                invest_button = ft.ElevatedButton(
+                refs['action_slot'].content = ft.ElevatedButton(
                     text="💰 Investir",
-                    on_click=create_invest_click_handler(i),
                     bgcolor="#059669",
                     color="#FFFFFF",
                     height=32
                 )
             else:
-                invest_button = ft.Container(
+                refs['action_slot'].content = ft.Container(
                     content=ft.Text("✅ Completa", size=12, weight=ft.FontWeight.BOLD, color="#059669"),
                     bgcolor="#ECFDF5",
                     border_radius=6,
-                    padding=ft.padding.symmetric(horizontal=12, vertical=6)
+                    padding=_CHIP_PADDING
                 )
-
-            goal_card = ft.Container(
-                content=ft.Column([
-                    ft.Row([
-                        ft.Column([
-                            ft.Text(goal['name'], size=14, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                            ft.Text(status_text, size=11, color=status_color)
-                        ], expand=True, spacing=2),
-                        ft.IconButton(
-                            icon=ft.Icons.DELETE_OUTLINE,
-                            icon_color="#DC2626",
-                            icon_size=16,
-                            on_click=create_remove_click_handler(i),
-                            tooltip="Remover meta"
-                        )
-                    ]),
-                    ft.Container(height=8),
-                    ft.ProgressBar(
-                        value=min(progress, 1.0),
-                        bgcolor="#E5E7EB",
-                        color="#059669" if progress >= 1.0 else "#2563EB",
-                        height=6
-                    ),
-                    ft.Container(height=8),
-                    ft.Row([
-                        ft.Text(f"{saved_amount:,.0f} / {goal['total_cost']:,.0f} Kz", size=11, color="#6B7280"),
-                        ft.Text(f"{progress * 100:.0f}%", size=11, weight=ft.FontWeight.BOLD, color="#2563EB")
-                    ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                    ft.Container(height=8),
-                    invest_button
-                ]),
-                bgcolor="#FFFFFF",
-                border=ft.border.all(1, "#E5E7EB"),
-                border_radius=12,
-                padding=ft.padding.all(12),
-                margin=ft.margin.only(bottom=8)
-            )
-            self.goals_list.controls.append(goal_card)
+        if can_invest:
+            refs['action_slot'].content.data = goal.get('id')
+            refs['action_slot'].content.on_click = self._on_invest_click
 
     def update_debts_list(self):
-        """Atualiza lista de dívidas"""
+        """Atualiza lista de dívidas reutilizando os cartões já construídos"""
         self.debts_list.controls.clear()
+        self._card_build_generation['debts'] = self._card_build_generation.get('debts', 0) + 1
 
+        seen_ids = set()
+        pending = []  # cartões ainda por construir, diferidos para lotes
+        built_inline = 0
         for i, debt in enumerate(self.debts):
-            paid_amount = debt.get('paid_amount', 0)
-            progress = paid_amount / debt['total_amount'] if debt['total_amount'] > 0 else 0
-            remaining = debt['total_amount'] - paid_amount
-
-            # Status da dívida
-            if progress >= 1.0:
-                status_text = "✅ Quitada!"
-                status_color = "#059669"
-                can_pay = False
+            did = debt.get('id')
+            seen_ids.add(did)
+            refs = self._debt_card_cache.get(did)
+            # Depois do primeiro diferido, tudo é diferido para manter a ordem
+            if pending or (refs is None and built_inline >= self._INLINE_BUILD_LIMIT):
+                pending.append((i, debt))
+                continue
+            if refs is None:
+                built_inline += 1
+                refs = self._build_debt_card(i, debt)
+                if did is not None:
+                    self._debt_card_cache[did] = refs
             else:
-                status_text = f"💳 Devendo {remaining:,.0f} Kz"
-                status_color = "#DC2626"
-                can_pay = True
-
-            # Função para criar handler de clique seguro
-            def create_pay_click_handler(debt_index):
-                def handle_pay_click(e):
-                    print(f"Clique no botão pagar para dívida {debt_index}")
-                    self.show_pay_debt_dialog(debt_index)
-
-                return handle_pay_click
-
-            # Função para criar handler de remoção seguro
-            def create_remove_click_handler(debt_index):
-                def handle_remove_click(e):
-                    try:
-                        if debt_index < len(self.debts):
-                            self.debts.pop(debt_index)
-                            self.save_data()
-                            self.update_all_views()
-
-                            self.show_snack_bar("🗑️ Dívida removida!", "#DC2626")
-                    except Exception as ex:
-                        print(f"Erro ao remover dívida: {ex}")
-
-                return handle_remove_click
-
-            # Botão de pagamento
+                self._refresh_debt_card(refs, i, debt)
+            self.debts_list.controls.append(refs['container'])
+
+        if pending:
+            self._schedule_card_builds('debts', self.debts_list, self._debt_card_cache,
+                                       self._build_debt_card, self._refresh_debt_card, pending)
+
+        # Descarta cartões de dívidas entretanto removidas
+        for did in list(self._debt_card_cache):
+            if did not in seen_ids:
+                del self._debt_card_cache[did]
+
+    def _build_debt_card(self, index, debt):
+        """Constrói um cartão de dívida e guarda as referências aos nós mutáveis"""
+        refs = {
+            'name_text': ft.Text(debt['name'], size=14, weight=ft.FontWeight.BOLD, color="#1F2937"),
+            'status_text': ft.Text("", size=11),
+            'remove_button': ft.IconButton(
+                icon=ft.Icons.DELETE_OUTLINE,
+                icon_color="#DC2626",
+                icon_size=16,
+                tooltip="Remover dívida"
+            ),
+            'progress_bar': ft.ProgressBar(value=0, bgcolor="#E5E7EB", color="#DC2626", height=6),
+            'range_text': ft.Text("", size=11, color="#6B7280"),
+            'pct_text': ft.Text("", size=11, weight=ft.FontWeight.BOLD, color="#DC2626"),
+            'action_slot': ft.Container(),
+            'can_pay': None
+        }
+        refs['container'] = ft.Container(
+            content=ft.Column([
+                ft.Row([
+                    ft.Column([refs['name_text'], refs['status_text']], expand=True, spacing=2),
+                    refs['remove_button']
+                ]),
+                ft.Container(height=8),
+                refs['progress_bar'],
+                ft.Container(height=8),
+                ft.Row([refs['range_text'], refs['pct_text']], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                ft.Container(height=8),
+                refs['action_slot']
+            ]),
+            bgcolor="#FFFFFF",
+            border=_BORDER_GRAY,
+            border_radius=12,
+            padding=_PADDING_12,
+            margin=_MARGIN_B8
+        )
+        self._refresh_debt_card(refs, index, debt)
+        return refs
+
+    def _refresh_debt_card(self, refs, index, debt, _fmt=_fmt_num, _min=min):
+        """Escreve os valores atuais da dívida no cartão existente
+
+        _fmt/_min seguem o mesmo esquema de ligação na definição do
+        refresher de metas.
+        """
+        paid_amount = debt['paid_amount']
+        progress = paid_amount / debt['total_amount'] if debt['total_amount'] > 0 else 0
+        remaining = debt['total_amount'] - paid_amount
+
+        # Status da dívida
+        if progress >= 1.0:
+            status_text = "✅ Quitada!"
+            status_color = "#059669"
+            can_pay = False
+        else:
+            status_text = f"💳 Devendo {_fmt(remaining)} Kz"
+            status_color = "#DC2626"
+            can_pay = True
+
+        refs['name_text'].value = debt['name']
+        refs['status_text'].value = status_text
+        refs['status_text'].color = status_color
+        refs['progress_bar'].value = _min(progress, 1.0)
+        refs['progress_bar'].color = "#059669" if progress >= 1.0 else "#DC2626"
+        refs['range_text'].value = f"{_fmt(paid_amount)} / {_fmt(debt['total_amount'])} Kz"
+        refs['pct_text'].value = f"{progress * 100:.0f}%"
+
+        refs['remove_button'].data = debt.get('id')
+        refs['remove_button'].on_click = self._on_remove_debt_click
+
+        # O slot de ação só é reconstruído quando o estado muda
+        if can_pay != refs['can_pay']:
+            refs['can_pay'] = can_pay
             if can_pay:
-                pay_button = ft.ElevatedButton(
+                refs['action_slot'].content = ft.ElevatedButton(
                     text="💳 Pagar",
-                    on_click=create_pay_click_handler(i),
                     bgcolor="#DC2626",
                     color="#FFFFFF",
                     height=32
                 )
             else:
-                pay_button = ft.Container(
+                refs['action_slot'].content = ft.Container(
                     content=ft.Text("✅ Quitada", size=12, weight=ft.FontWeight.BOLD, color="#059669"),
                     bgcolor="#ECFDF5",
                     border_radius=6,
-                    padding=ft.padding.symmetric(horizontal=12, vertical=6)
+                    padding=_CHIP_PADDING
                 )
-
-            debt_card = ft.Container(
-                content=ft.Column([
-                    ft.Row([
-                        ft.Column([
-                            ft.Text(debt['name'], size=14, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                            ft.Text(status_text, size=11, color=status_color)
-                        ], expand=True, spacing=2),
-                        ft.IconButton(
-                            icon=ft.Icons.DELETE_OUTLINE,
-                            icon_color="#DC2626",
-                            icon_size=16,
-                            on_click=create_remove_click_handler(i),
-                            tooltip="Remover dívida"
-                        )
-                    ]),
-                    ft.Container(height=8),
-                    ft.ProgressBar(
-                        value=min(progress, 1.0),
-                        bgcolor="#E5E7EB",
-                        color="#059669" if progress >= 1.0 else "#DC2626",
-                        height=6
-                    ),
-                    ft.Container(height=8),
-                    ft.Row([
-                        ft.Text(f"{paid_amount:,.0f} / {debt['total_amount']:,.0f} Kz", size=11, color="#6B7280"),
-                        ft.Text(f"{progress * 100:.0f}%", size=11, weight=ft.FontWeight.BOLD, color="#DC2626")
-                    ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                    ft.Container(height=8),
-                    pay_button
-                ]),
-                bgcolor="#FFFFFF",
-                border=ft.border.all(1, "#E5E7EB"),
-                border_radius=12,
-                padding=ft.padding.all(12),
-                margin=ft.margin.only(bottom=8)
-            )
-            self.debts_list.controls.append(debt_card)
+        if can_pay:
+            refs['action_slot'].content.data = debt.get('id')
+            refs['action_slot'].content.on_click = self._on_pay_debt_click
 
     def update_debts_to_receive_list(self):
         """Atualiza lista de dívidas a receber"""
         self.debts_to_receive_list.controls.clear()
 
+        # Mesmo esquema da lista de despesas: nomes do loop ligados a
+        # locais para evitar LOAD_GLOBAL + LOAD_ATTR por widget
+        Container = ft.Container
+        Row = ft.Row
+        Column = ft.Column
+        Text = ft.Text
+        IconButton = ft.IconButton
+        ProgressBar = ft.ProgressBar
+        BOLD = ft.FontWeight.BOLD
+
         for i, debt in enumerate(self.debts_to_receive):
-            received_amount = debt.get('received_amount', 0)
-            progress = received_amount / debt['total_amount'] if debt['total_amount'] > 0 else 0
-            remaining = debt['total_amount'] - received_amount
+            total_amount = debt['total_amount']
+            debt_id = debt.get('id')
+            received_amount = debt['received_amount']
+            progress = received_amount / total_amount if total_amount > 0 else 0
+            remaining = total_amount - received_amount
 
             # Status da dívida a receber
             if progress >= 1.0:
@@ -2140,149 +2648,166 @@ class FinancialApp:
                 status_color = "#059669"
                 can_receive = False
             else:
-                status_text = f"💸 Faltam {remaining:,.0f} Kz"
+                status_text = f"💸 Faltam {_fmt_kz(remaining)}"
                 status_color = "#059669"
                 can_receive = True
 
-            # Função para criar handler de clique seguro
-            def create_receive_click_handler(debt_index):
-                def handle_receive_click(e):
-                    print(f"Clique no botão receber para dívida {debt_index}")
-                    self.show_receive_payment_dialog(debt_index)
-
-                return handle_receive_click
-
-            # Função para criar handler de remoção seguro
-            def create_remove_click_handler(debt_index):
-                def handle_remove_click(e):
-                    try:
-                        if debt_index < len(self.debts_to_receive):
-                            self.debts_to_receive.pop(debt_index)
-                            self.save_data()
-                            self.update_all_views()
-
-                            self.show_snack_bar("🗑️ Dívida a receber removida!", "#DC2626")
-                    except Exception as ex:
-                        print(f"Erro ao remover dívida a receber: {ex}")
-
-                return handle_remove_click
-
             # Botão de recebimento
             if can_receive:
                 receive_button = ft.ElevatedButton(
                     text="💸 Receber",
-                    on_click=create_receive_click_handler(i),
+                    data=debt_id,
+                    on_click=self._on_receive_click,
                     bgcolor="#059669",
                     color="#FFFFFF",
                     height=32
                 )
             else:
-                receive_button = ft.Container(
-                    content=ft.Text("✅ Recebida", size=12, weight=ft.FontWeight.BOLD, color="#059669"),
+                receive_button = Container(
+                    content=Text("✅ Recebida", size=12, weight=BOLD, color="#059669"),
                     bgcolor="#ECFDF5",
                     border_radius=6,
-                    padding=ft.padding.symmetric(horizontal=12, vertical=6)
+                    padding=_CHIP_PADDING
                 )
 
-            debt_card = ft.Container(
-                content=ft.Column([
-                    ft.Row([
-                        ft.Column([
-                            ft.Text(debt['name'], size=14, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                            ft.Text(status_text, size=11, color=status_color),
-                            ft.Text(f"📅 Vence: {debt.get('due_date', 'N/A')}", size=10, color="#6B7280")
+            debt_card = Container(
+                content=Column([
+                    Row([
+                        Column([
+                            Text(debt['name'], size=14, weight=BOLD, color="#1F2937"),
+                            Text(status_text, size=11, color=status_color),
+                            Text(f"📅 Vence: {debt.get('due_date', 'N/A')}", size=10, color="#6B7280")
                         ], expand=True, spacing=2),
-                        ft.IconButton(
+                        IconButton(
                             icon=ft.Icons.DELETE_OUTLINE,
                             icon_color="#DC2626",
                             icon_size=16,
-                            on_click=create_remove_click_handler(i),
+                            data=debt_id,
+                            on_click=self._on_remove_receivable_click,
                             tooltip="Remover dívida a receber"
                         )
                     ]),
-                    ft.Container(height=8),
-                    ft.ProgressBar(
+                    Container(height=8),
+                    ProgressBar(
                         value=min(progress, 1.0),
                         bgcolor="#E5E7EB",
                         color="#059669",
                         height=6
                     ),
-                    ft.Container(height=8),
-                    ft.Row([
-                        ft.Text(f"{received_amount:,.0f} / {debt['total_amount']:,.0f} Kz", size=11, color="#6B7280"),
-                        ft.Text(f"{progress * 100:.0f}%", size=11, weight=ft.FontWeight.BOLD, color="#059669")
+                    Container(height=8),
+                    Row([
+                        Text(f"{_fmt_num(received_amount)} / {_fmt_num(total_amount)} Kz", size=11, color="#6B7280"),
+                        Text(f"{progress * 100:.0f}%", size=11, weight=BOLD, color="#059669")
                     ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                    ft.Container(height=8),
+                    Container(height=8),
                     receive_button
                 ]),
                 bgcolor="#FFFFFF",
-                border=ft.border.all(1, "#E5E7EB"),
+                border=_BORDER_GRAY,
                 border_radius=12,
-                padding=ft.padding.all(12),
-                margin=ft.margin.only(bottom=8)
+                padding=_PADDING_12,
+                margin=_MARGIN_B8
             )
             self.debts_to_receive_list.controls.append(debt_card)
 
+    def _refresh_finances_view(self):
+        """Escreve os totais atuais nos nós já construídos da vista de finanças"""
+        total_spent, current_balance = self.calculate_totals()
+
+        self._fin_month_text.value = f"Mês: {self.current_month}"
+        self._fin_total_text.value = _fmt_num(self.salary)
+        self._fin_spent_text.value = _fmt_num(total_spent)
+        self._fin_balance_text.value = _fmt_num(current_balance)
+        self._fin_balance_text.color = _sign_color(current_balance >= 0)
+        self._fin_balance_box.bgcolor = "#ECFDF5" if current_balance >= 0 else "#FEF2F2"
+        self._fin_usage_text.value = f"{(total_spent / self.salary * 100):,.0f}%" if self.salary > 0 else "0%"
+        self._fin_analysis_slot.content = self._build_spending_analysis()
+        self.update_expenses_list()
+
     def update_finances_view(self):
-        """Atualiza vista de finanças"""
-        self.create_finances_view()
-        if hasattr(self, 'content_container') and hasattr(self, 'finances_view'):
-            if self.current_view_index == 0:
-                self.content_container.content = self.finances_view
+        """Atualiza vista de finanças (constrói uma única vez, depois só escreve valores)"""
+        if self.finances_view is None:
+            self.create_finances_view()
+        else:
+            self._refresh_finances_view()
+        self._show_view_if_current(0, self.finances_view)
 
     def update_goals_view(self):
         """Atualiza vista de metas"""
-        self.create_goals_view()
-        if hasattr(self, 'content_container') and hasattr(self, 'goals_view'):
-            if self.current_view_index == 1:
-                self.content_container.content = self.goals_view
+        if self.goals_view is None:
+            self.create_goals_view()
+        else:
+            _, current_balance = self.calculate_totals()
+            self._goals_balance_text.value = _fmt_kz(current_balance)
+            self._goals_balance_text.color = _sign_color(current_balance >= 0)
+            self.update_goals_list()
+        self._show_view_if_current(1, self.goals_view)
 
     def update_extras_view(self):
         """Atualiza vista de extras"""
-        self.create_extras_view()
-        if hasattr(self, 'content_container') and hasattr(self, 'extras_view'):
-            if self.current_view_index == 2:
-                self.content_container.content = self.extras_view
+        if self.extras_view is None:
+            self.create_extras_view()
+        else:
+            self.update_debts_list()
+            self.update_debts_to_receive_list()
+        self._show_view_if_current(2, self.extras_view)
 
     def update_summary_view(self):
-        """Atualiza vista de resumo"""
-        self.create_summary_view()
-        if hasattr(self, 'content_container') and hasattr(self, 'summary_view'):
-            if self.current_view_index == 3:
-                self.content_container.content = self.summary_view
-
-    def update_all_views(self):
-        """Atualiza todas as vistas"""
-        if self.current_view_index == 0:
-            self.update_finances_view()
-        elif self.current_view_index == 1:
-            self.update_goals_view()
-        elif self.current_view_index == 2:
-            self.update_extras_view()
-        elif self.current_view_index == 3:
-            self.update_summary_view()
-
-        self.page.update()
+        """Atualiza vista de resumo
+
+        O dashboard é derivado na íntegra dos totais e das transações; uma
+        assinatura barata desses valores evita reconstruí-lo quando uma
+        mutação não o afetou (p.ex. criar uma meta sem investir nela).
+        """
+        total_spent, current_balance = self.calculate_totals()
+        sig = (self.salary, total_spent, current_balance,
+               self._mutation_count, self._total_to_receive)
+        if self.summary_view is None:
+            self.create_summary_view()
+            self._summary_sig = sig
+        elif sig != self._summary_sig:
+            self._refresh_summary_view()
+            self._summary_sig = sig
+        self._show_view_if_current(3, self.summary_view)
+
+    def _show_view_if_current(self, index, view):
+        """Coloca a view no container de conteúdo se for a selecionada"""
+        if self.content_container is not None and self.current_view_index == index:
+            self.content_container.content.content = view
+
+    # Vistas (índices de _view_updaters) que apresentam cada secção de dados
+    _SECTION_VIEWS = {
+        'meta': (0, 1, 3),
+        'expenses': (0, 1, 3),
+        'goals': (1,),
+        'debts': (2,),
+        'debts_to_receive': (2, 3),
+    }
+
+    def update_views_for(self, *sections):
+        """Marca como sujas apenas as vistas que mostram as secções alteradas
+
+        A vista visível é posta em dia já (se afetada); as restantes ficam
+        para a navegação, via update_content_for_current_view. Mutar as
+        dívidas com a vista de metas aberta, por exemplo, deixa de pagar o
+        refresh de uma vista que nem mostra esses dados.
+        """
+        for section in sections:
+            for index in self._SECTION_VIEWS[section]:
+                self._view_dirty[index] = True
+        index = self.current_view_index
+        if self._view_dirty[index]:
+            self._view_updaters[index]()
+            self._view_dirty[index] = False
+
+        self._request_update()
 
 
 def main(page: ft.Page):
     """Função principal otimizada para mobile"""
     try:
-        loading = ft.Container(
-            content=ft.Column([
-                ft.ProgressRing(width=40, height=40, stroke_width=3, color="#2563EB"),
-                ft.Container(height=16),
-                ft.Text("💰 Carregando...", size=16, weight=ft.FontWeight.BOLD, color="#2563EB")
-            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-            bgcolor="#FAFBFF",
-            expand=True,
-            alignment=ft.alignment.center
-        )
-
-        page.add(loading)
-        page.update()
-
-        page.controls.clear()
+        # Constrói a app diretamente: o ecrã de loading intermédio custava
+        # um ciclo extra de layout + update antes do primeiro frame útil
         app = FinancialApp(page)
 
     except Exception as e:
@@ -2302,7 +2827,7 @@ def main(page: ft.Page):
             bgcolor="#FAFBFF",
             expand=True,
             alignment=ft.alignment.center,
-            padding=ft.padding.all(20)
+            padding=_PADDING_20
         )
         page.add(error_container)
         page.update()